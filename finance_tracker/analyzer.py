@@ -36,7 +36,7 @@ Example:
 from collections import defaultdict
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from finance_tracker.models import MonthlySummary, SpendingPattern, Transaction
 
@@ -71,6 +71,12 @@ class SpendingAnalyzer:
             if t.date.year == year and t.date.month == month
         ]
 
+        return self._summarize_month(year, month, month_transactions)
+
+    def _summarize_month(
+        self, year: int, month: int, month_transactions: List[Transaction]
+    ) -> MonthlySummary:
+        """Build the summary for one month from that month's transactions."""
         total_income = Decimal("0")
         total_expenses = Decimal("0")
         category_breakdown: Dict[str, Decimal] = defaultdict(Decimal)
@@ -106,12 +112,16 @@ class SpendingAnalyzer:
         Returns:
             List of MonthlySummary objects, sorted by year and month
         """
-        # Get all unique year-month combinations
-        months = set()
+        # Group by year and month in a single pass, rather than filtering the
+        # whole list once per month
+        by_month: Dict[Tuple[int, int], List[Transaction]] = defaultdict(list)
         for transaction in self.transactions:
-            months.add((transaction.date.year, transaction.date.month))
+            by_month[(transaction.date.year, transaction.date.month)].append(transaction)
 
-        summaries = [self.get_monthly_summary(year, month) for year, month in sorted(months)]
+        summaries = [
+            self._summarize_month(year, month, by_month[(year, month)])
+            for year, month in sorted(by_month)
+        ]
         return summaries
 
     def get_category_breakdown(
@@ -215,6 +225,28 @@ class SpendingAnalyzer:
         sorted_patterns = sorted(patterns, key=lambda p: p.total_amount, reverse=True)
         return sorted_patterns[:limit]
 
+    def get_totals(
+        self, year: Optional[int] = None, month: Optional[int] = None
+    ) -> Tuple[Decimal, Decimal]:
+        """
+        Calculate total income and total expenses in a single pass.
+
+        Args:
+            year: Optional year to filter by
+            month: Optional month to filter by (requires year)
+
+        Returns:
+            Tuple of (total income, total expenses)
+        """
+        total_income = Decimal("0")
+        total_expenses = Decimal("0")
+        for transaction in self._filter_transactions(year, month):
+            if transaction.is_income:
+                total_income += transaction.absolute_amount
+            elif transaction.is_expense:
+                total_expenses += transaction.absolute_amount
+        return total_income, total_expenses
+
     def get_total_income(self, year: Optional[int] = None, month: Optional[int] = None) -> Decimal:
         """
         Calculate total income.
@@ -260,7 +292,8 @@ class SpendingAnalyzer:
         Returns:
             Net amount as Decimal
         """
-        return self.get_total_income(year, month) - self.get_total_expenses(year, month)
+        total_income, total_expenses = self.get_totals(year, month)
+        return total_income - total_expenses
 
     def get_average_monthly_spending(self, category_name: Optional[str] = None) -> Decimal:
         """
@@ -27,7 +27,7 @@ Example:
     >>> print(f"Success rate: {stats.categorization_rate:.1f}%")
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from finance_tracker.category_mapper import CategoryMapper, get_default_mapper
 from finance_tracker.models import Category, Transaction
@@ -94,18 +94,8 @@ class TransactionCategorizer:
         category = self.mapper.categorize(transaction.description)
 
         if category:
-            # Create new transaction with category
-            return Transaction(
-                date=transaction.date,
-                amount=transaction.amount,
-                description=transaction.description,
-                category=category,
-                transaction_type=transaction.transaction_type,
-                account=transaction.account,
-                reference=transaction.reference,
-                balance=transaction.balance,
-                notes=transaction.notes,
-            )
+            # Copy with the new category, keeping ID and recurring/split links
+            return transaction.model_copy(update={"category": category})
 
         return transaction
 
@@ -126,12 +116,27 @@ class TransactionCategorizer:
         stats = CategorizationStats()
         stats.total_transactions = len(transactions)
 
+        # Statements repeat the same merchants, so each distinct description
+        # is matched against the rules once per batch
+        matches: Dict[str, Optional[Category]] = {}
+
         for transaction in transactions:
             # Check if already categorized
             was_categorized = transaction.category is not None
 
-            # Categorize transaction
-            categorized = self.categorize_transaction(transaction, overwrite=overwrite)
+            # Categorize transaction (same as categorize_transaction)
+            if was_categorized and not overwrite:
+                categorized = transaction
+            else:
+                description = transaction.description
+                if description in matches:
+                    category = matches[description]
+                else:
+                    category = matches[description] = self.mapper.categorize(description)
+                if category:
+                    categorized = transaction.model_copy(update={"category": category})
+                else:
+                    categorized = transaction
 
             # Update statistics
             if categorized.category is not None:
@@ -36,10 +36,13 @@ Example:
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Pattern
+from typing import Dict, List, Optional, Pattern, Tuple
 
 from finance_tracker.models import Category
 
+# Maximum number of descriptions whose match results are remembered
+MATCH_CACHE_SIZE = 4096
+
 
 @dataclass
 class CategoryRule:
@@ -66,6 +69,14 @@ class CategoryMapper:
         if custom_rules:
             self.rules.extend(custom_rules)
 
+        # One shared Category per (name, parent); categories are immutable
+        self._categories: Dict[Tuple[str, Optional[str]], Category] = {}
+
+        # Match results by description, valid for one version of self.rules
+        self._match_cache: Dict[str, Optional[Category]] = {}
+        self._match_cache_rules: Optional[List[CategoryRule]] = None
+        self._match_cache_rule_count = 0
+
     def _load_default_rules(self) -> None:
         """Load default category mapping rules."""
         # Food & Dining
@@ -153,14 +164,37 @@ class CategoryMapper:
         """
         description_clean = description.strip()
 
+        # Rules may be edited in place (e.g. by CategoryRulesManager), which
+        # always replaces the list or changes its length
+        rules = self.rules
+        if self._match_cache_rules is not rules or self._match_cache_rule_count != len(rules):
+            self._match_cache.clear()
+            self._match_cache_rules = rules
+            self._match_cache_rule_count = len(rules)
+        elif description_clean in self._match_cache:
+            return self._match_cache[description_clean]
+
+        category = None
         # Check rules in order (first match wins)
-        for rule in self.rules:
+        for rule in rules:
             if rule.pattern.search(description_clean):
-                return Category(
-                    name=rule.category_name, parent=rule.parent_category, description=None
-                )
-
-        return None
+                category = self._category_for(rule)
+                break
+
+        if len(self._match_cache) >= MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[description_clean] = category
+        return category
+
+    def _category_for(self, rule: CategoryRule) -> Category:
+        """Get the shared Category instance a rule assigns."""
+        key = (rule.category_name, rule.parent_category)
+        category = self._categories.get(key)
+        if category is None:
+            category = self._categories[key] = Category(
+                name=rule.category_name, parent=rule.parent_category, description=None
+            )
+        return category
 
     def add_custom_rule(
         self, pattern: str, category_name: str, parent_category: Optional[str] = None, case_sensitive: bool = False
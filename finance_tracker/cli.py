@@ -277,9 +277,8 @@ def stats(ctx: click.Context):
     workflow = FinanceTrackerWorkflow(data_dir=data_dir)
     analyzer = workflow.analyze_spending()
 
-    total_income = analyzer.get_total_income()
-    total_expenses = analyzer.get_total_expenses()
-    net_amount = analyzer.get_net_amount()
+    total_income, total_expenses = analyzer.get_totals()
+    net_amount = total_income - total_expenses
 
     click.echo("\nOverall Statistics")
     click.echo("=" * 50)
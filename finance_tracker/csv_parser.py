@@ -29,11 +29,12 @@ Example:
 """
 
 import csv
+import functools
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from finance_tracker.models import Category, Transaction, TransactionType
 
@@ -91,32 +92,35 @@ class CSVParser:
             CSVParserError: If file cannot be read
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames
-                if headers is None:
-                    raise InvalidDataError("CSV file has no headers")
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                return self._format_from_headers(_first_row(csv.reader(f)))
 
-                headers_lower = [h.lower().strip() for h in headers]
+        except FileNotFoundError:
+            raise CSVParserError(f"File not found: {file_path}")
+        except Exception as e:
+            raise CSVParserError(f"Error reading CSV file: {e}") from e
 
-                # Check for alternative format
-                if "transaction date" in headers_lower and "type" in headers_lower:
-                    return CSVFormat.ALTERNATIVE
+    @staticmethod
+    def _format_from_headers(headers: Optional[List[str]]) -> CSVFormat:
+        """Detect the CSV format from a header row."""
+        if headers is None:
+            raise InvalidDataError("CSV file has no headers")
 
-                # Check for debit/credit format
-                if "debit" in headers_lower and "credit" in headers_lower:
-                    return CSVFormat.DEBIT_CREDIT
+        headers_lower = {h.lower().strip() for h in headers}
 
-                # Check for standard format
-                if "date" in headers_lower and "amount" in headers_lower and "description" in headers_lower:
-                    return CSVFormat.STANDARD
+        # Check for alternative format
+        if "transaction date" in headers_lower and "type" in headers_lower:
+            return CSVFormat.ALTERNATIVE
 
-                return CSVFormat.UNKNOWN
+        # Check for debit/credit format
+        if "debit" in headers_lower and "credit" in headers_lower:
+            return CSVFormat.DEBIT_CREDIT
 
-        except FileNotFoundError:
-            raise CSVParserError(f"File not found: {file_path}")
-        except Exception as e:
-            raise CSVParserError(f"Error reading CSV file: {e}") from e
+        # Check for standard format
+        if {"date", "amount", "description"} <= headers_lower:
+            return CSVFormat.STANDARD
+
+        return CSVFormat.UNKNOWN
 
     def parse(self, file_path: Path) -> List[Transaction]:
         """
@@ -133,205 +137,256 @@ class CSVParser:
             InvalidDataError: If CSV data is invalid
             CSVParserError: For other parsing errors
         """
-        format_type = self.detect_format(file_path)
+        return list(self.iter_parse(file_path))
 
-        if format_type == CSVFormat.UNKNOWN:
-            raise UnsupportedFormatError(f"Unsupported CSV format in file: {file_path}")
+    def iter_parse(self, file_path: Path) -> Iterator[Transaction]:
+        """
+        Parse a CSV file, yielding transactions as rows are read.
 
-        parser_map = {
-            CSVFormat.STANDARD: self._parse_standard,
-            CSVFormat.ALTERNATIVE: self._parse_alternative,
-            CSVFormat.DEBIT_CREDIT: self._parse_debit_credit,
-        }
+        The file is opened once: the format is detected from the header row
+        and the remaining rows are read as plain lists, with columns looked
+        up by index.
 
-        parser = parser_map[format_type]
-        return parser(file_path)
+        Args:
+            file_path: Path to CSV file
 
-    def _parse_standard(self, file_path: Path) -> List[Transaction]:
-        """Parse standard format CSV (Date, Description, Amount, Balance)."""
-        transactions = []
+        Yields:
+            Transaction objects in file order
 
+        Raises:
+            UnsupportedFormatError: If CSV format is not supported
+            InvalidDataError: If CSV data is invalid
+            CSVParserError: For other parsing errors
+        """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                    try:
-                        # Parse date
-                        date_str = row.get("Date", "").strip()
-                        if not date_str:
-                            continue  # Skip empty rows
-                        transaction_date = self._parse_date(date_str)
-
-                        # Parse description
-                        description = row.get("Description", "").strip()
-                        if not description:
-                            raise InvalidDataError(f"Row {row_num}: Missing description")
-
-                        # Parse amount
-                        amount_str = row.get("Amount", "").strip()
-                        amount = self._parse_decimal(amount_str)
-                        if amount == 0:
-                            continue  # Skip zero-amount transactions
-
-                        # Determine transaction type
-                        transaction_type = TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT
+            f = open(file_path, "r", encoding="utf-8", newline="")
+        except FileNotFoundError as e:
+            raise CSVParserError(f"File not found: {file_path}") from e
+        except Exception as e:
+            raise CSVParserError(f"Error reading CSV file: {e}") from e
 
-                        # Parse balance if available
-                        balance = None
-                        balance_str = row.get("Balance", "").strip()
-                        if balance_str:
-                            balance = self._parse_decimal(balance_str)
-
-                        transaction = Transaction(
-                            date=transaction_date,
-                            amount=amount,
-                            description=description,
-                            transaction_type=transaction_type,
-                            account=self.account,
-                            balance=balance,
-                        )
-                        transactions.append(transaction)
-
-                    except (ValueError, InvalidDataError) as e:
-                        raise InvalidDataError(f"Row {row_num}: {e}") from e
+        with f:
+            # Blank lines are skipped, as csv.DictReader does
+            rows = (row for row in csv.reader(f) if row)
+            try:
+                headers = _first_row(rows)
+                format_type = self._format_from_headers(headers)
+            except Exception as e:
+                raise CSVParserError(f"Error reading CSV file: {e}") from e
+            # _format_from_headers rejects a file without a header row
+            assert headers is not None
+
+            if format_type == CSVFormat.UNKNOWN:
+                raise UnsupportedFormatError(f"Unsupported CSV format in file: {file_path}")
+
+            parser_map = {
+                CSVFormat.STANDARD: self._parse_standard,
+                CSVFormat.ALTERNATIVE: self._parse_alternative,
+                CSVFormat.DEBIT_CREDIT: self._parse_debit_credit,
+            }
+
+            # Later duplicate headers win, as with csv.DictReader
+            columns = {name: index for index, name in enumerate(headers)}
+            yield from parser_map[format_type](rows, columns)
+
+    def _parse_standard(
+        self, rows: Iterator[List[str]], columns: Dict[str, int]
+    ) -> Iterator[Transaction]:
+        """Parse standard format CSV (Date, Description, Amount, Balance)."""
+        date_col = columns.get("Date")
+        description_col = columns.get("Description")
+        amount_col = columns.get("Amount")
+        balance_col = columns.get("Balance")
+
+        try:
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+                try:
+                    # Parse date
+                    date_str = _field(row, date_col).strip()
+                    if not date_str:
+                        continue  # Skip empty rows
+                    transaction_date = self._parse_date(date_str)
+
+                    # Parse description
+                    description = _field(row, description_col).strip()
+                    if not description:
+                        raise InvalidDataError(f"Row {row_num}: Missing description")
+
+                    # Parse amount
+                    amount_str = _field(row, amount_col).strip()
+                    amount = self._parse_decimal(amount_str)
+                    if amount == 0:
+                        continue  # Skip zero-amount transactions
+
+                    # Determine transaction type
+                    transaction_type = TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT
+
+                    # Parse balance if available
+                    balance = None
+                    balance_str = _field(row, balance_col).strip()
+                    if balance_str:
+                        balance = self._parse_decimal(balance_str)
+
+                    # Every field is parsed and checked above (amount is
+                    # finite and non-zero), so construction skips validation
+                    yield Transaction.model_construct(
+                        date=transaction_date,
+                        amount=amount,
+                        description=description,
+                        transaction_type=transaction_type,
+                        account=self.account,
+                        balance=balance,
+                    )
+
+                except (ValueError, InvalidDataError) as e:
+                    raise InvalidDataError(f"Row {row_num}: {e}") from e
 
         except Exception as e:
             if isinstance(e, InvalidDataError):
                 raise
             raise CSVParserError(f"Error parsing standard format CSV: {e}") from e
 
-        return transactions
-
-    def _parse_alternative(self, file_path: Path) -> List[Transaction]:
+    def _parse_alternative(
+        self, rows: Iterator[List[str]], columns: Dict[str, int]
+    ) -> Iterator[Transaction]:
         """Parse alternative format CSV (Transaction Date, Post Date, Description, Category, Type, Amount)."""
-        transactions = []
+        transaction_date_col = columns.get("Transaction Date")
+        post_date_col = columns.get("Post Date")
+        description_col = columns.get("Description")
+        amount_col = columns.get("Amount")
+        type_col = columns.get("Type")
+        category_col = columns.get("Category")
+
+        # Rows with the same category text share one (immutable) Category
+        categories: Dict[str, Category] = {}
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Parse date (prefer Transaction Date, fallback to Post Date)
-                        date_str = row.get("Transaction Date", "").strip() or row.get("Post Date", "").strip()
-                        if not date_str:
-                            continue
-                        transaction_date = self._parse_date(date_str)
-
-                        # Parse description
-                        description = row.get("Description", "").strip()
-                        if not description:
-                            raise InvalidDataError(f"Row {row_num}: Missing description")
-
-                        # Parse amount
-                        amount_str = row.get("Amount", "").strip()
-                        amount = self._parse_decimal(amount_str)
-                        if amount == 0:
-                            continue
-
-                        # Parse transaction type
-                        type_str = row.get("Type", "").strip().lower()
-                        if type_str == "credit":
-                            transaction_type = TransactionType.CREDIT
-                        elif type_str == "debit":
-                            transaction_type = TransactionType.DEBIT
-                        elif type_str == "transfer":
-                            transaction_type = TransactionType.TRANSFER
-                        else:
-                            # Infer from amount
-                            transaction_type = TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT
-
-                        # Parse category if available
-                        category = None
-                        category_str = row.get("Category", "").strip()
-                        if category_str:
-                            category = Category(name=category_str)
-
-                        transaction = Transaction(
-                            date=transaction_date,
-                            amount=amount,
-                            description=description,
-                            transaction_type=transaction_type,
-                            category=category,
-                            account=self.account,
-                        )
-                        transactions.append(transaction)
-
-                    except (ValueError, InvalidDataError) as e:
-                        raise InvalidDataError(f"Row {row_num}: {e}") from e
+            for row_num, row in enumerate(rows, start=2):
+                try:
+                    # Parse date (prefer Transaction Date, fallback to Post Date)
+                    date_str = _field(row, transaction_date_col).strip() or _field(row, post_date_col).strip()
+                    if not date_str:
+                        continue
+                    transaction_date = self._parse_date(date_str)
+
+                    # Parse description
+                    description = _field(row, description_col).strip()
+                    if not description:
+                        raise InvalidDataError(f"Row {row_num}: Missing description")
+
+                    # Parse amount
+                    amount_str = _field(row, amount_col).strip()
+                    amount = self._parse_decimal(amount_str)
+                    if amount == 0:
+                        continue
+
+                    # Parse transaction type
+                    type_str = _field(row, type_col).strip().lower()
+                    if type_str == "credit":
+                        transaction_type = TransactionType.CREDIT
+                    elif type_str == "debit":
+                        transaction_type = TransactionType.DEBIT
+                    elif type_str == "transfer":
+                        transaction_type = TransactionType.TRANSFER
+                    else:
+                        # Infer from amount
+                        transaction_type = TransactionType.CREDIT if amount > 0 else TransactionType.DEBIT
+
+                    # Parse category if available
+                    category = None
+                    category_str = _field(row, category_col).strip()
+                    if category_str:
+                        category = categories.get(category_str)
+                        if category is None:
+                            category = categories[category_str] = Category(name=category_str)
+
+                    yield Transaction.model_construct(
+                        date=transaction_date,
+                        amount=amount,
+                        description=description,
+                        transaction_type=transaction_type,
+                        category=category,
+                        account=self.account,
+                    )
+
+                except (ValueError, InvalidDataError) as e:
+                    raise InvalidDataError(f"Row {row_num}: {e}") from e
 
         except Exception as e:
             if isinstance(e, InvalidDataError):
                 raise
             raise CSVParserError(f"Error parsing alternative format CSV: {e}") from e
 
-        return transactions
-
-    def _parse_debit_credit(self, file_path: Path) -> List[Transaction]:
+    def _parse_debit_credit(
+        self, rows: Iterator[List[str]], columns: Dict[str, int]
+    ) -> Iterator[Transaction]:
         """Parse debit/credit format CSV (Date, Description, Debit, Credit, Balance)."""
-        transactions = []
+        date_col = columns.get("Date")
+        description_col = columns.get("Description")
+        debit_col = columns.get("Debit")
+        credit_col = columns.get("Credit")
+        balance_col = columns.get("Balance")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Parse date
-                        date_str = row.get("Date", "").strip()
-                        if not date_str:
-                            continue
-                        transaction_date = self._parse_date(date_str)
-
-                        # Parse description
-                        description = row.get("Description", "").strip()
-                        if not description:
-                            raise InvalidDataError(f"Row {row_num}: Missing description")
-
-                        # Parse debit and credit
-                        debit_str = row.get("Debit", "").strip()
-                        credit_str = row.get("Credit", "").strip()
-
-                        debit = self._parse_decimal(debit_str) if debit_str else Decimal("0")
-                        credit = self._parse_decimal(credit_str) if credit_str else Decimal("0")
-
-                        # Determine amount and type
-                        if debit > 0 and credit > 0:
-                            raise InvalidDataError(f"Row {row_num}: Both debit and credit cannot be non-zero")
-                        elif debit > 0:
-                            amount = -debit  # Negative for debits
-                            transaction_type = TransactionType.DEBIT
-                        elif credit > 0:
-                            amount = credit  # Positive for credits
-                            transaction_type = TransactionType.CREDIT
-                        else:
-                            continue  # Skip rows with no amount
-
-                        # Parse balance if available
-                        balance = None
-                        balance_str = row.get("Balance", "").strip()
-                        if balance_str:
-                            balance = self._parse_decimal(balance_str)
-
-                        transaction = Transaction(
-                            date=transaction_date,
-                            amount=amount,
-                            description=description,
-                            transaction_type=transaction_type,
-                            account=self.account,
-                            balance=balance,
-                        )
-                        transactions.append(transaction)
-
-                    except (ValueError, InvalidDataError) as e:
-                        raise InvalidDataError(f"Row {row_num}: {e}") from e
+            for row_num, row in enumerate(rows, start=2):
+                try:
+                    # Parse date
+                    date_str = _field(row, date_col).strip()
+                    if not date_str:
+                        continue
+                    transaction_date = self._parse_date(date_str)
+
+                    # Parse description
+                    description = _field(row, description_col).strip()
+                    if not description:
+                        raise InvalidDataError(f"Row {row_num}: Missing description")
+
+                    # Parse debit and credit
+                    debit_str = _field(row, debit_col).strip()
+                    credit_str = _field(row, credit_col).strip()
+
+                    debit = self._parse_decimal(debit_str) if debit_str else Decimal("0")
+                    credit = self._parse_decimal(credit_str) if credit_str else Decimal("0")
+
+                    # Determine amount and type
+                    if debit > 0 and credit > 0:
+                        raise InvalidDataError(f"Row {row_num}: Both debit and credit cannot be non-zero")
+                    elif debit > 0:
+                        amount = -debit  # Negative for debits
+                        transaction_type = TransactionType.DEBIT
+                    elif credit > 0:
+                        amount = credit  # Positive for credits
+                        transaction_type = TransactionType.CREDIT
+                    else:
+                        continue  # Skip rows with no amount
+
+                    # Parse balance if available
+                    balance = None
+                    balance_str = _field(row, balance_col).strip()
+                    if balance_str:
+                        balance = self._parse_decimal(balance_str)
+
+                    # Every field is parsed and checked above (amount is
+                    # finite and non-zero), so construction skips validation
+                    yield Transaction.model_construct(
+                        date=transaction_date,
+                        amount=amount,
+                        description=description,
+                        transaction_type=transaction_type,
+                        account=self.account,
+                        balance=balance,
+                    )
+
+                except (ValueError, InvalidDataError) as e:
+                    raise InvalidDataError(f"Row {row_num}: {e}") from e
 
         except Exception as e:
             if isinstance(e, InvalidDataError):
                 raise
             raise CSVParserError(f"Error parsing debit/credit format CSV: {e}") from e
 
-        return transactions
-
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_date(date_str: str) -> date:
         """
         Parse date string into date object.
@@ -341,7 +396,9 @@ class CSVParser:
         - US format: MM/DD/YYYY (e.g., "01/15/2024")
         - European format: DD/MM/YYYY (e.g., "15/01/2024")
 
-        The method tries formats in order until one succeeds.
+        The method tries the formats matching the date's separator in order
+        until one succeeds. Results are cached, since statement dates repeat
+        across many rows.
 
         Args:
             date_str: Date string to parse
@@ -360,23 +417,28 @@ class CSVParser:
         """
         date_str = date_str.strip()
 
-        # Try ISO format first (YYYY-MM-DD) - most common in modern exports
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            pass
-
-        # Try US format (MM/DD/YYYY) - common in US bank statements
-        try:
-            return datetime.strptime(date_str, "%m/%d/%Y").date()
-        except ValueError:
-            pass
-
-        # Try European format (DD/MM/YYYY) - common in European bank statements
-        try:
-            return datetime.strptime(date_str, "%d/%m/%Y").date()
-        except ValueError:
-            pass
+        # Pick the candidate formats from the separator, so a date only
+        # raises on the formats that share its shape
+        formats: Tuple[str, ...]
+        if "/" in date_str:
+            formats = ("%m/%d/%Y", "%d/%m/%Y")
+        else:
+            # ISO format (YYYY-MM-DD) - most common in modern exports.
+            # fromisoformat is much faster than strptime; strptime still
+            # accepts dates without zero padding (e.g. "2024-1-5")
+            if len(date_str) == 10:
+                try:
+                    return date.fromisoformat(date_str)
+                except ValueError:
+                    pass
+            formats = ("%Y-%m-%d",)
+
+        # US format (MM/DD/YYYY) is tried before European (DD/MM/YYYY)
+        for fmt in formats:
+            try:
+                return datetime.strptime(date_str, fmt).date()
+            except ValueError:
+                pass
 
         # If all formats fail, raise an error with helpful message
         raise ValueError(f"Unable to parse date: {date_str}. Supported formats: YYYY-MM-DD, MM/DD/YYYY, DD/MM/YYYY")
@@ -414,14 +476,40 @@ class CSVParser:
         if not value_str or not value_str.strip():
             return Decimal("0")
 
-        # Remove common formatting characters
-        # Order matters: remove $ before processing negative signs
-        cleaned = value_str.strip().replace("$", "").replace(",", "").replace(" ", "")
-
+        # Fast path: plain amounts such as "-50.00" (Decimal ignores
+        # surrounding whitespace itself)
         try:
-            return Decimal(cleaned)
-        except InvalidOperation as e:
-            raise ValueError(f"Unable to parse decimal: {value_str}") from e
+            value = Decimal(value_str)
+        except InvalidOperation:
+            # Remove common formatting characters
+            # Order matters: remove $ before processing negative signs
+            cleaned = value_str.strip().replace("$", "").replace(",", "").replace(" ", "")
+
+            # Accounting style negatives: (50.00)
+            if cleaned.startswith("(") and cleaned.endswith(")"):
+                cleaned = "-" + cleaned[1:-1]
+
+            try:
+                value = Decimal(cleaned)
+            except InvalidOperation as e:
+                raise ValueError(f"Unable to parse decimal: {value_str}") from e
+
+        # Parsed rows skip model validation, so reject "NaN" and "Infinity" here
+        if not value.is_finite():
+            raise ValueError(f"Unable to parse decimal: {value_str}")
+        return value
+
+
+def _first_row(rows: Iterable[List[str]]) -> Optional[List[str]]:
+    """Return the first non-empty row (the header), or None if there is none."""
+    return next((row for row in rows if row), None)
+
+
+def _field(row: List[str], index: Optional[int]) -> str:
+    """Get a column value by index, or "" if the column is absent or the row is short."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
 
 
 def parse_csv(file_path: Path, account: Optional[str] = None) -> List[Transaction]:
@@ -163,7 +163,10 @@ class RecurringTransactionDetector:
         # Check amount consistency
         amounts = [abs(t.amount) for t in transactions]
         if amounts:
-            amount_variance = (max(amounts) - min(amounts)) / max(amounts) if max(amounts) > 0 else 1.0
+            # Amounts are Decimal; the score is a float
+            amount_variance = (
+                float((max(amounts) - min(amounts)) / max(amounts)) if max(amounts) > 0 else 1.0
+            )
             consistency_score = max(0, 1.0 - amount_variance)
         else:
             consistency_score = 0.5
@@ -229,10 +232,8 @@ class RecurringTransactionDetector:
             if pattern in pattern_map:
                 recurring = pattern_map[pattern]
                 # Create updated transaction with recurring info
-                updated = Transaction(
-                    **transaction.model_dump(),
-                    is_recurring=True,
-                    recurring_id=recurring.id,
+                updated = transaction.model_copy(
+                    update={"is_recurring": True, "recurring_id": recurring.id}
                 )
                 updated_transactions.append(updated)
             else:
@@ -5,14 +5,18 @@ This module provides powerful search and filtering capabilities for transactions
 """
 
 import logging
+from collections import defaultdict
 from datetime import date
 from decimal import Decimal
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 from finance_tracker.models import Transaction
 
 logger = logging.getLogger(__name__)
 
+# Length of the substrings indexed for text search
+TRIGRAM_SIZE = 3
+
 
 class TransactionSearchFilter:
     """Advanced search and filter for transactions."""
@@ -23,8 +27,15 @@ class TransactionSearchFilter:
 
         Args:
             transactions: List of transactions to search/filter
+
+        Indexes over the transactions are built on first use and reused by
+        later searches, so keep one instance per unchanging transaction list.
         """
         self.transactions = transactions
+        # Positions of transactions by lowercased category name / account
+        self._field_index: Optional[Dict[str, Dict[str, List[int]]]] = None
+        # Positions of transactions containing each lowercased trigram
+        self._trigram_index: Optional[Dict[str, Set[int]]] = None
 
     def search(
         self,
@@ -55,7 +66,7 @@ class TransactionSearchFilter:
         Returns:
             Filtered list of transactions
         """
-        results = self.transactions
+        results = self._candidates(query, category, account)
 
         # Text search
         if query:
@@ -109,6 +120,71 @@ class TransactionSearchFilter:
 
         return results
 
+    def _candidates(
+        self, query: Optional[str], category: Optional[str], account: Optional[str]
+    ) -> List[Transaction]:
+        """
+        Narrow the transactions to search using the indexes.
+
+        The result is a superset of the matches, in original order; search()
+        still applies every filter to it.
+        """
+        positions: Optional[Set[int]] = None
+
+        if category or account:
+            field_index = self._get_field_index()
+            if category:
+                positions = set(field_index["category"].get(category.lower(), ()))
+            if account:
+                account_positions = field_index["account"].get(account, ())
+                positions = (
+                    set(account_positions)
+                    if positions is None
+                    else positions.intersection(account_positions)
+                )
+
+        if query and len(query) >= TRIGRAM_SIZE:
+            trigram_index = self._get_trigram_index()
+            for trigram in _trigrams(query.lower()):
+                trigram_positions = trigram_index.get(trigram, set())
+                positions = (
+                    set(trigram_positions)
+                    if positions is None
+                    else positions & trigram_positions
+                )
+                if not positions:
+                    break
+
+        if positions is None:
+            return self.transactions
+        return [self.transactions[i] for i in sorted(positions)]
+
+    def _get_field_index(self) -> Dict[str, Dict[str, List[int]]]:
+        """Build (once) the category and account indexes."""
+        if self._field_index is None:
+            by_category: Dict[str, List[int]] = defaultdict(list)
+            by_account: Dict[str, List[int]] = defaultdict(list)
+            for i, transaction in enumerate(self.transactions):
+                if transaction.category:
+                    by_category[transaction.category.name.lower()].append(i)
+                if transaction.account:
+                    by_account[transaction.account].append(i)
+            self._field_index = {"category": by_category, "account": by_account}
+        return self._field_index
+
+    def _get_trigram_index(self) -> Dict[str, Set[int]]:
+        """Build (once) the trigram index over descriptions and notes."""
+        if self._trigram_index is None:
+            index: Dict[str, Set[int]] = defaultdict(set)
+            for i, transaction in enumerate(self.transactions):
+                trigrams = _trigrams(transaction.description.lower())
+                if transaction.notes:
+                    trigrams |= _trigrams(transaction.notes.lower())
+                for trigram in trigrams:
+                    index[trigram].add(i)
+            self._trigram_index = index
+        return self._trigram_index
+
     def advanced_query(self, query_dict: Dict) -> List[Transaction]:
         """
         Execute advanced query from dictionary.
@@ -157,3 +233,7 @@ class TransactionSearchFilter:
                 accounts.add(transaction.account)
         return sorted(list(accounts))
 
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the set of trigrams (3-character substrings) in a string."""
+    return {text[i : i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
@@ -38,13 +38,17 @@ Example:
     >>> storage.export_transactions_csv(Path("export.csv"))
 """
 
+import hashlib
 import json
 import logging
+import os
+import sys
+import threading
 import uuid
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
 from finance_tracker.models import Category, Transaction
 
@@ -63,6 +67,49 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _write_json_atomic(path: Path, data: Dict, **dumps_kwargs) -> None:
+    """
+    Serialize data to JSON and atomically replace the file at path.
+
+    The whole payload is built in memory, written with a single call to a
+    temporary file next to the target, flushed to disk and then moved into
+    place, so readers never observe a partially written file.
+    """
+    payload = json.dumps(data, cls=JSONEncoder, **dumps_kwargs).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _write_json_list_atomic(path: Path, key: str, items: Iterable[Dict]) -> int:
+    """
+    Stream {key: [items...]} as indented JSON and atomically replace path.
+
+    Items are encoded and written one at a time, so only one is held in
+    memory as JSON; the output matches json.dumps(..., indent=2).
+
+    Returns:
+        Number of items written
+    """
+    encoder = JSONEncoder(indent=2)
+    count = 0
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(f"{{\n  {json.dumps(key)}: [")
+        for item in items:
+            f.write(",\n    " if count else "\n    ")
+            f.write(encoder.encode(item).replace("\n", "\n    "))
+            count += 1
+        f.write("\n  ]\n}" if count else "]\n}")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
 class TransactionRepository:
     """Repository for managing transaction storage."""
 
@@ -76,6 +123,13 @@ class TransactionRepository:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.transactions_file = self.data_dir / "transactions.json"
+        # Shared Category instances (categories are immutable)
+        self._category_pool: Dict[tuple, Category] = {}
+        # Fingerprint index of stored transactions, keyed to the file's signature
+        self._id_index: Optional[Set[int]] = None
+        self._id_index_signature: Optional[Tuple[int, int, int]] = None
+        # Serializes read-modify-write cycles between threads sharing this repository
+        self._write_lock = threading.RLock()
 
     def save(self, transactions: List[Transaction]) -> None:
         """
@@ -85,39 +139,116 @@ class TransactionRepository:
             transactions: List of transactions to save
         """
         try:
-            # Load existing transactions
-            existing = self.load_all()
-            existing_ids = {self._transaction_id(t) for t in existing}
-
-            # Add new transactions (avoid duplicates)
-            new_transactions = []
-            for transaction in transactions:
-                # Generate ID if not present
-                if not transaction.id:
-                    transaction.id = str(uuid.uuid4())
-                txn_id = self.transaction_id(transaction)
-                if txn_id not in existing_ids:
-                    new_transactions.append(transaction)
-                    existing_ids.add(txn_id)
-
-            all_transactions = existing + new_transactions
+            self.apply_changeset(inserts=transactions)
+        except Exception as e:
+            logger.error(f"Error saving transactions: {e}")
+            raise
 
-            # Serialize to JSON
-            data = {
-                "transactions": [
-                    self._serialize_transaction(t) for t in all_transactions
-                ]
-            }
+    def apply_changeset(
+        self,
+        inserts: Optional[List[Transaction]] = None,
+        updates: Optional[List[Transaction]] = None,
+        deletes: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """
+        Apply inserts, updates and deletes to storage with a single write.
 
-            # Write to file
-            with open(self.transactions_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, cls=JSONEncoder)
+        Deletes are applied first, then updates, then inserts. Inserts get an
+        ID if they don't have one and are skipped if they duplicate a stored
+        transaction or an earlier insert in the same changeset (see
+        transaction_id). Nothing is written if no change applies.
 
-            logger.info(f"Saved {len(new_transactions)} new transactions (total: {len(all_transactions)})")
+        The whole changeset commits as one atomic file replace, and the
+        load-modify-write cycle holds a lock so concurrent changesets on
+        this repository cannot overwrite each other.
 
-        except Exception as e:
-            logger.error(f"Error saving transactions: {e}")
-            raise
+        Args:
+            inserts: New transactions to add
+            updates: Updated transactions (each must have an ID)
+            deletes: IDs of transactions to delete
+
+        Returns:
+            Dictionary with "inserted", "updated" and "deleted" counts
+        """
+        with self._write_lock:
+            return self._apply_changeset(inserts, updates, deletes)
+
+    def _apply_changeset(
+        self,
+        inserts: Optional[List[Transaction]],
+        updates: Optional[List[Transaction]],
+        deletes: Optional[List[str]],
+    ) -> Dict[str, int]:
+        """Apply a changeset; the caller holds the write lock."""
+        replacements: Dict[str, Transaction] = {}
+        for transaction in updates or []:
+            if not transaction.id:
+                raise ValueError("Transaction must have an ID to update")
+            replacements[transaction.id] = transaction
+
+        # Work on the raw records so stored transactions are never rebuilt
+        signature = self._file_signature()
+        records = self._load_records()
+
+        deleted_count = 0
+        if deletes:
+            delete_ids = set(deletes)
+            original_count = len(records)
+            records = [r for r in records if r.get("id") not in delete_ids]
+            deleted_count = original_count - len(records)
+
+        updated_count = 0
+        if replacements:
+            for i, record in enumerate(records):
+                record_id = record.get("id")
+                if record_id in replacements:
+                    records[i] = self._serialize_transaction(replacements[record_id])
+                    updated_count += 1
+
+        # Index fingerprints without building Transaction objects, reusing
+        # the cached index while the stored rows are unchanged
+        if (
+            not deleted_count
+            and not updated_count
+            and self._id_index is not None
+            and signature == self._id_index_signature
+        ):
+            existing_ids = set(self._id_index)
+        else:
+            existing_ids = {self._record_id(r) for r in records}
+
+        # Add new transactions, skipping stored duplicates and duplicates
+        # within the batch (first occurrence wins)
+        new_by_id: Dict[int, Transaction] = {}
+        for transaction in inserts or []:
+            # Generate ID if not present
+            if not transaction.id:
+                transaction.id = str(uuid.uuid4())
+            txn_id = self.transaction_id(transaction)
+            if txn_id not in existing_ids and txn_id not in new_by_id:
+                new_by_id[txn_id] = transaction
+
+        counts = {
+            "inserted": len(new_by_id),
+            "updated": updated_count,
+            "deleted": deleted_count,
+        }
+        if not any(counts.values()):
+            # Nothing to persist; leave the file untouched
+            return counts
+
+        records.extend(self._serialize_transaction(t) for t in new_by_id.values())
+
+        self._write_records(records)
+        existing_ids.update(new_by_id)
+        self._id_index = existing_ids
+        self._id_index_signature = self._file_signature()
+
+        logger.info(
+            f"Inserted {counts['inserted']}, updated {counts['updated']} and deleted "
+            f"{counts['deleted']} transactions (total: {len(records)})"
+        )
+        return counts
 
     def load_all(self) -> List[Transaction]:
         """
@@ -126,22 +257,8 @@ class TransactionRepository:
         Returns:
             List of Transaction objects
         """
-        if not self.transactions_file.exists():
-            return []
-
         try:
-            with open(self.transactions_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            transactions = []
-            for txn_data in data.get("transactions", []):
-                try:
-                    transaction = self._deserialize_transaction(txn_data)
-                    transactions.append(transaction)
-                except Exception as e:
-                    logger.warning(f"Error deserializing transaction: {e}")
-                    continue
-
+            transactions = list(self.iter_all())
             logger.info(f"Loaded {len(transactions)} transactions")
             return transactions
 
@@ -149,6 +266,77 @@ class TransactionRepository:
             logger.error(f"Error loading transactions: {e}")
             raise
 
+    def iter_all(self) -> Iterator[Transaction]:
+        """
+        Iterate over stored transactions, building one at a time.
+
+        Records that fail to deserialize are skipped with a warning.
+
+        Yields:
+            Transaction objects in storage order
+        """
+        for txn_data in self._load_records():
+            try:
+                yield self._deserialize_transaction(txn_data)
+            except Exception as e:
+                logger.warning(f"Error deserializing transaction: {e}")
+
+    def load_ids(self) -> Set[int]:
+        """
+        Load the fingerprints of all stored transactions.
+
+        Only the fields that make up the fingerprint are read from the raw
+        records, so no Transaction objects are constructed.
+
+        Returns:
+            Set of transaction fingerprints (see transaction_id)
+        """
+        return {self._record_id(r) for r in self._load_records()}
+
+    def _stored_ids(self) -> Set[int]:
+        """
+        Internal method to get the fingerprint index of stored transactions.
+
+        The index is kept in memory and rebuilt only when the transactions file
+        has been modified since it was last read.
+        """
+        signature = self._file_signature()
+        if self._id_index is None or signature != self._id_index_signature:
+            self._id_index = self.load_ids()
+            self._id_index_signature = signature
+        return self._id_index
+
+    def data_version(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Get a token that changes whenever the transactions file is rewritten.
+
+        Callers that cache transactions can compare tokens to detect writes
+        made through any repository instance.
+
+        Returns:
+            Opaque version token, or None if nothing has been stored yet
+        """
+        return self._file_signature()
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Internal method to get the transactions file's (inode, mtime, size), if it exists."""
+        try:
+            stat = self.transactions_file.stat()
+        except FileNotFoundError:
+            return None
+        # Every write replaces the file, so the inode changes even when a
+        # same-size rewrite lands within the filesystem's mtime granularity
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load_records(self) -> List[Dict]:
+        """Internal method to load the raw serialized transaction records."""
+        if not self.transactions_file.exists():
+            return []
+
+        with open(self.transactions_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cast(List[Dict], data.get("transactions", []))
+
     def find_duplicates(self, transactions: List[Transaction]) -> List[Transaction]:
         """
         Find duplicate transactions in the provided list.
@@ -159,11 +347,15 @@ class TransactionRepository:
         Returns:
             List of duplicate transactions
         """
-        seen: Set[str] = set()
-        duplicates = []
+        ids = [self.transaction_id(t) for t in transactions]
 
-        for transaction in transactions:
-            txn_id = self.transaction_id(transaction)
+        # Common case: every fingerprint is unique, checked in a single C pass
+        if len(set(ids)) == len(ids):
+            return []
+
+        seen: Set[int] = set()
+        duplicates = []
+        for transaction, txn_id in zip(transactions, ids):
             if txn_id in seen:
                 duplicates.append(transaction)
             else:
@@ -181,14 +373,34 @@ class TransactionRepository:
         Returns:
             List of transactions that are duplicates of stored transactions
         """
-        stored = self.load_all()
-        stored_ids = {self.transaction_id(t) for t in stored}
+        return self.partition_duplicates(transactions)[1]
+
+    def partition_duplicates(
+        self, transactions: List[Transaction]
+    ) -> Tuple[List[Transaction], List[Transaction]]:
+        """
+        Split transactions into new ones and duplicates of stored transactions.
 
-        duplicates = [
-            t for t in transactions if self.transaction_id(t) in stored_ids
-        ]
+        Each transaction is fingerprinted once, so callers that need both
+        halves avoid matching the duplicates a second time.
 
-        return duplicates
+        Args:
+            transactions: List of transactions to check
+
+        Returns:
+            Tuple of (new transactions, duplicates), each in input order
+        """
+        stored_ids = self._stored_ids()
+
+        new: List[Transaction] = []
+        duplicates: List[Transaction] = []
+        for transaction in transactions:
+            if self.transaction_id(transaction) in stored_ids:
+                duplicates.append(transaction)
+            else:
+                new.append(transaction)
+
+        return new, duplicates
 
     def get_by_id(self, transaction_id: str) -> Optional[Transaction]:
         """
@@ -200,11 +412,28 @@ class TransactionRepository:
         Returns:
             Transaction if found, None otherwise
         """
-        transactions = self.load_all()
-        for transaction in transactions:
-            if transaction.id == transaction_id:
-                return transaction
-        return None
+        return self.get_many([transaction_id]).get(transaction_id)
+
+    def get_many(self, transaction_ids: List[str]) -> Dict[str, Transaction]:
+        """
+        Get several transactions by ID with a single pass over storage.
+
+        Args:
+            transaction_ids: Transaction IDs to look up
+
+        Returns:
+            Dictionary mapping each found ID to its transaction
+        """
+        wanted = set(transaction_ids)
+        found: Dict[str, Transaction] = {}
+        # Only the matching records are deserialized
+        for record in self._load_records():
+            txn_id = record.get("id")
+            if txn_id in wanted and txn_id not in found:
+                found[txn_id] = self._deserialize_transaction(record)
+                if len(found) == len(wanted):
+                    break
+        return found
 
     def update(self, transaction: Transaction) -> bool:
         """
@@ -216,23 +445,19 @@ class TransactionRepository:
         Returns:
             True if updated, False if transaction not found
         """
-        if not transaction.id:
-            raise ValueError("Transaction must have an ID to update")
+        return self.update_many([transaction]) > 0
 
-        transactions = self.load_all()
-        updated = False
-
-        for i, txn in enumerate(transactions):
-            if txn.id == transaction.id:
-                transactions[i] = transaction
-                updated = True
-                break
+    def update_many(self, transactions: List[Transaction]) -> int:
+        """
+        Update multiple existing transactions with a single write.
 
-        if updated:
-            self._save_all(transactions)
-            logger.info(f"Updated transaction {transaction.id}")
+        Args:
+            transactions: Updated transactions (each must have an ID)
 
-        return updated
+        Returns:
+            Number of transactions updated
+        """
+        return self.apply_changeset(updates=transactions)["updated"]
 
     def delete(self, transaction_id: str) -> bool:
         """
@@ -244,16 +469,7 @@ class TransactionRepository:
         Returns:
             True if deleted, False if not found
         """
-        transactions = self.load_all()
-        original_count = len(transactions)
-        transactions = [t for t in transactions if t.id != transaction_id]
-
-        if len(transactions) < original_count:
-            self._save_all(transactions)
-            logger.info(f"Deleted transaction {transaction_id}")
-            return True
-
-        return False
+        return self.delete_multiple([transaction_id]) > 0
 
     def delete_multiple(self, transaction_ids: List[str]) -> int:
         """
@@ -265,29 +481,40 @@ class TransactionRepository:
         Returns:
             Number of transactions deleted
         """
-        transactions = self.load_all()
-        original_count = len(transactions)
-        transaction_ids_set = set(transaction_ids)
-        transactions = [t for t in transactions if t.id not in transaction_ids_set]
+        return self.apply_changeset(deletes=transaction_ids)["deleted"]
 
-        deleted_count = original_count - len(transactions)
-        if deleted_count > 0:
-            self._save_all(transactions)
-            logger.info(f"Deleted {deleted_count} transactions")
+    def replace_all(self, transactions: List[Transaction]) -> None:
+        """
+        Replace all stored transactions with a single write.
+
+        Use this for whole-store rewrites (recategorization, recurring
+        marking) instead of per-transaction updates.
 
-        return deleted_count
+        Args:
+            transactions: Complete list of transactions to store
+        """
+        with self._write_lock:
+            self._save_all(transactions)
+        logger.info(f"Replaced stored transactions (total: {len(transactions)})")
 
     def _save_all(self, transactions: List[Transaction]) -> None:
         """Internal method to save all transactions."""
-        data = {
-            "transactions": [
-                self._serialize_transaction(t) for t in transactions
-            ]
-        }
-        with open(self.transactions_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, cls=JSONEncoder)
+        self._write_records([self._serialize_transaction(t) for t in transactions])
+
+    def _write_records(self, records: List[Dict]) -> None:
+        """
+        Internal method to write serialized transaction records.
 
-    def transaction_id(self, transaction: Transaction) -> str:
+        The store is written as compact JSON (no indentation or padding) since
+        it is only read back by the repository; use the exports for a
+        human-readable copy. Records are kept newest first (ISO dates sort
+        lexically), so readers can page through load_all() without sorting.
+        """
+        records.sort(key=lambda r: r.get("date", ""), reverse=True)
+        _write_json_atomic(self.transactions_file, {"transactions": records}, separators=(",", ":"))
+        self._id_index = None
+
+    def transaction_id(self, transaction: Transaction) -> int:
         """
         Generate a unique identifier for a transaction.
 
@@ -300,32 +527,54 @@ class TransactionRepository:
         - Description (normalized to lowercase)
         - Reference number (if available)
 
+        The attributes are hashed into an 8-byte blake2b digest so the fingerprint
+        is a single 64-bit integer, which is cheap to hash and store in sets.
         Two transactions with the same fingerprint are considered duplicates.
 
         Args:
             transaction: Transaction to identify
 
         Returns:
-            Unique identifier string (pipe-separated values)
+            Unique identifier (64-bit integer digest)
 
         Example:
             >>> repo.transaction_id(transaction)
-            '2024-01-15|-50.00|grocery store #1234|REF123'
-        """
-        # Build fingerprint from key attributes
-        # Date and amount are most important for uniqueness
-        parts = [
-            transaction.date.isoformat(),  # ISO format for consistency
-            str(transaction.amount),  # Exact amount match
-            transaction.description.strip().lower(),  # Normalized description
-        ]
+            1532941620467453061
+        """
+        return self._fingerprint(
+            transaction.date.isoformat(),
+            str(transaction.amount),
+            transaction.description,
+            transaction.reference,
+        )
+
+    def _record_id(self, data: Dict) -> int:
+        """Compute the fingerprint of a serialized transaction record."""
+        return self._fingerprint(
+            data.get("date", ""),
+            data.get("amount", ""),
+            data.get("description", ""),
+            data.get("reference"),
+        )
+
+    @staticmethod
+    def _fingerprint(
+        date_str: str, amount_str: str, description: str, reference: Optional[str]
+    ) -> int:
+        """Hash the fingerprint fields into a 64-bit integer."""
+        # Date and amount are most important for uniqueness; the description is
+        # normalized so case and surrounding whitespace don't matter. str.lower()
+        # already has a C fast path for ASCII text, and encoding the joined string
+        # once is cheaper than lowering each field as bytes.
+        parts = [date_str, amount_str, description.strip().lower()]
         # Add reference if available (some banks include transaction IDs)
-        if transaction.reference:
-            parts.append(transaction.reference)
-        # Use pipe separator (unlikely to appear in transaction data)
-        return "|".join(parts)
+        if reference:
+            parts.append(reference)
+        # Encode once and hash in a single call so the work stays in C
+        digest = hashlib.blake2b("|".join(parts).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
 
-    def _transaction_id(self, transaction: Transaction) -> str:
+    def _transaction_id(self, transaction: Transaction) -> int:
         """Private alias for backward compatibility."""
         return self.transaction_id(transaction)
 
@@ -377,12 +626,12 @@ class TransactionRepository:
 
         category = None
         if "category" in data:
-            cat_data = data["category"]
-            category = Category(
-                name=cat_data["name"],
-                parent=cat_data.get("parent"),
-                description=cat_data.get("description"),
-            )
+            category = self._pooled_category(data["category"])
+
+        account = data.get("account")
+        if account:
+            # Few distinct accounts appear across many transactions
+            account = sys.intern(account)
 
         return Transaction(
             date=date.fromisoformat(data["date"]),
@@ -390,7 +639,7 @@ class TransactionRepository:
             description=data["description"],
             transaction_type=TransactionType(data["transaction_type"]),
             category=category,
-            account=data.get("account"),
+            account=account,
             reference=data.get("reference"),
             balance=Decimal(data["balance"]) if data.get("balance") else None,
             notes=data.get("notes"),
@@ -400,6 +649,28 @@ class TransactionRepository:
             parent_transaction_id=data.get("parent_transaction_id"),
         )
 
+    def _pooled_category(self, cat_data: Dict) -> Category:
+        """Get a shared Category instance for serialized category data."""
+        key = (cat_data["name"], cat_data.get("parent"), cat_data.get("description"))
+        category = self._category_pool.get(key)
+        if category is None:
+            category = Category(name=key[0], parent=key[1], description=key[2])
+            self._category_pool[key] = category
+        return category
+
+    def intern_category(self, category: Category) -> Category:
+        """
+        Get the shared instance equal to a category, adding it if new.
+
+        Args:
+            category: Category to intern
+
+        Returns:
+            Pooled Category instance shared with loaded transactions
+        """
+        key = (category.name, category.parent, category.description)
+        return self._category_pool.setdefault(key, category)
+
 
 class CategoryRepository:
     """Repository for managing category storage."""
@@ -447,8 +718,7 @@ class CategoryRepository:
             }
 
             # Write to file
-            with open(self.categories_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            _write_json_atomic(self.categories_file, data, indent=2)
 
             logger.info(f"Saved {len(new_categories)} new categories (total: {len(all_categories)})")
 
@@ -511,17 +781,14 @@ class StorageManager:
         Args:
             output_file: Path to output JSON file
         """
-        transactions = self.transaction_repo.load_all()
-        data = {
-            "transactions": [
-                self.transaction_repo._serialize_transaction(t) for t in transactions
-            ]
-        }
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, cls=JSONEncoder)
+        repo = self.transaction_repo
+        count = _write_json_list_atomic(
+            Path(output_file),
+            "transactions",
+            (repo._serialize_transaction(t) for t in repo.iter_all()),
+        )
 
-        logger.info(f"Exported {len(transactions)} transactions to {output_file}")
+        logger.info(f"Exported {count} transactions to {output_file}")
 
     def export_transactions_csv(self, output_file: Path) -> None:
         """
@@ -535,9 +802,9 @@ class StorageManager:
         transactions = self.transaction_repo.load_all()
 
         with open(output_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow(
+                [
                     "Date",
                     "Description",
                     "Amount",
@@ -548,24 +815,29 @@ class StorageManager:
                     "Reference",
                     "Balance",
                     "Notes",
-                ],
+                ]
             )
-            writer.writeheader()
-
-            for transaction in transactions:
-                row = {
-                    "Date": transaction.date.isoformat(),
-                    "Description": transaction.description,
-                    "Amount": str(transaction.amount),
-                    "Category": transaction.category.name if transaction.category else "",
-                    "Parent Category": transaction.category.parent if transaction.category else "",
-                    "Type": transaction.transaction_type.value,
-                    "Account": transaction.account or "",
-                    "Reference": transaction.reference or "",
-                    "Balance": str(transaction.balance) if transaction.balance else "",
-                    "Notes": transaction.notes or "",
-                }
-                writer.writerow(row)
+
+            # Hand all rows to the C writer in one call
+            writer.writerows(_csv_row(t) for t in transactions)
 
         logger.info(f"Exported {len(transactions)} transactions to {output_file}")
 
+
+def _csv_row(transaction: Transaction) -> tuple:
+    """Build a CSV export row for a transaction."""
+    # Bind optional nested values once per row
+    category = transaction.category
+    balance = transaction.balance
+    return (
+        transaction.date.isoformat(),
+        transaction.description,
+        str(transaction.amount),
+        category.name if category else "",
+        category.parent if category else "",
+        transaction.transaction_type.value,
+        transaction.account or "",
+        transaction.reference or "",
+        str(balance) if balance else "",
+        transaction.notes or "",
+    )
@@ -5,14 +5,31 @@ This module provides functionality to edit, delete, split, and merge transaction
 """
 
 import logging
+import os
 import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from finance_tracker.models import Category, SplitTransaction, Transaction
 
 logger = logging.getLogger(__name__)
 
+# Maximum allowed difference between the split total and the original amount
+SPLIT_TOLERANCE = Decimal("0.01")
+
+# Maximum number of transactions kept in the editor's lookup cache
+CACHE_SIZE = 256
+
+
+def _batch_uuids(count: int) -> List[str]:
+    """Generate random (version 4) UUID strings from a single urandom call."""
+    entropy = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=entropy[i : i + 16], version=4)) for i in range(0, 16 * count, 16)
+    ]
+
 
 class TransactionEditor:
     """Transaction editing and management."""
@@ -25,6 +42,47 @@ class TransactionEditor:
             transaction_repo: TransactionRepository instance
         """
         self.repo = transaction_repo
+        # LRU cache of fetched transactions, valid for one repository version
+        self._cache: "OrderedDict[str, Transaction]" = OrderedDict()
+        self._cache_version = None
+        # Buffered changes while a batch() block is active
+        self._pending: Optional[Dict[str, list]] = None
+        # Latest buffered version of each row inserted or updated in the batch
+        self._buffered: Dict[str, Transaction] = {}
+
+    @contextmanager
+    def batch(self) -> Iterator["TransactionEditor"]:
+        """
+        Buffer all changes made inside the block and write them once on exit.
+
+        Reads inside the block see the buffered changes. If the block raises,
+        the buffered changes are discarded. Nested batches join the outer one.
+
+        Example:
+            >>> with editor.batch():
+            ...     editor.edit_transaction(txn_id, notes="checked")
+            ...     editor.delete_transaction(other_id)
+        """
+        if self._pending is not None:
+            yield self
+            return
+
+        # Rows cached before the batch may be stale; check storage once here,
+        # reads inside the batch then skip the check
+        self._validate_cache()
+        self._pending = {"inserts": [], "updates": [], "deletes": []}
+        try:
+            yield self
+            pending = self._pending
+        finally:
+            self._pending = None
+            self._buffered = {}
+            # The cache may hold buffered rows that were never written
+            self._cache.clear()
+            self._cache_version = None
+
+        if any(pending.values()):
+            self.repo.apply_changeset(**pending)
 
     def edit_transaction(
         self,
@@ -38,6 +96,10 @@ class TransactionEditor:
         """
         Edit a transaction.
 
+        The update is a shallow model_copy, so values are stored as given
+        and must already have the field types (Decimal amount, date,
+        Category); only the non-zero amount rule is re-checked.
+
         Args:
             transaction_id: Transaction ID
             description: New description (optional)
@@ -49,25 +111,33 @@ class TransactionEditor:
         Returns:
             Updated transaction or None if not found
         """
-        transaction = self.repo.get_by_id(transaction_id)
+        transaction = self._get(transaction_id)
         if not transaction:
             return None
-
-        # Create updated transaction
-        updated_data = transaction.model_dump()
-        if description is not None:
-            updated_data["description"] = description
-        if amount is not None:
-            updated_data["amount"] = amount
-        if date is not None:
-            updated_data["date"] = date
         if category is not None:
-            updated_data["category"] = category
-        if notes is not None:
-            updated_data["notes"] = notes
+            category = self.repo.intern_category(category)
+
+        # Keep only the fields that were given and differ from the stored values
+        changes: Dict[str, Any] = {
+            field: value
+            for field, value in (
+                ("description", description),
+                ("amount", amount),
+                ("date", date),
+                ("category", category),
+                ("notes", notes),
+            )
+            if value is not None and getattr(transaction, field) != value
+        }
+        if not changes:
+            return transaction  # No-op edit; skip validation and the write
+
+        # Create updated transaction, copying only the changed fields
+        if "amount" in changes:
+            Transaction.validate_amount(changes["amount"])
 
-        updated = Transaction(**updated_data)
-        self.repo.update(updated)
+        updated = transaction.model_copy(update=changes)
+        self._write(updates=[updated])
         return updated
 
     def delete_transaction(self, transaction_id: str) -> bool:
@@ -80,7 +150,7 @@ class TransactionEditor:
         Returns:
             True if deleted
         """
-        return self.repo.delete(transaction_id)
+        return self.delete_multiple([transaction_id]) > 0
 
     def delete_multiple(self, transaction_ids: List[str]) -> int:
         """
@@ -92,7 +162,18 @@ class TransactionEditor:
         Returns:
             Number of transactions deleted
         """
-        return self.repo.delete_multiple(transaction_ids)
+        # Drop repeated IDs (e.g. from a UI multi-select) before any lookup
+        transaction_ids = list(dict.fromkeys(transaction_ids))
+        if not transaction_ids:
+            return 0
+
+        if self._pending is None:
+            self._cache.clear()
+            return self.repo.delete_multiple(transaction_ids)
+
+        found = self._get_many(transaction_ids)
+        self._write(deletes=list(found))
+        return len(found)
 
     def split_transaction(
         self, transaction_id: str, splits: List[SplitTransaction]
@@ -108,43 +189,59 @@ class TransactionEditor:
             List of new split transactions
 
         Raises:
-            ValueError: If splits don't sum to original amount
+            ValueError: If there are no splits, a split is zero, or they don't
+                sum to original amount
         """
-        original = self.repo.get_by_id(transaction_id)
+        if not splits:
+            raise ValueError("Need at least 1 split to split a transaction")
+
+        original = self._get(transaction_id)
         if not original:
             raise ValueError(f"Transaction {transaction_id} not found")
 
-        # Validate split amounts sum to original
-        total_split = sum(s.amount for s in splits)
-        if abs(total_split - abs(original.amount)) > Decimal("0.01"):
-            raise ValueError(
-                f"Split amounts ({total_split}) must equal original amount ({abs(original.amount)})"
-            )
-
-        # Create split transactions
-        split_transactions = []
+        # Validate split amounts sum to original. Splits take the original's
+        # sign, so their magnitudes are summed: a mixed-sign set like
+        # (15, -5) would otherwise pass for 10 and then store 15 + 5.
+        # The exact amounts are summed; rounding each split first would let
+        # sub-cent errors add up past the tolerance.
+        total_split = Decimal(0)
         for split in splits:
-            # Determine amount sign based on original
-            amount = (
-                -abs(split.amount) if original.amount < 0 else abs(split.amount)
+            Transaction.validate_amount(split.amount)
+            total_split += abs(split.amount)
+        original_abs = abs(original.amount)
+        if abs(total_split - original_abs) > SPLIT_TOLERANCE:
+            raise ValueError(
+                f"Split amounts ({total_split}) must equal original amount ({original_abs})"
             )
 
-            split_txn = Transaction(
-                date=original.date,
-                amount=amount,
-                description=f"{original.description} - {split.description or split.category.name}",
-                category=split.category,
-                transaction_type=original.transaction_type,
-                account=original.account,
-                reference=original.reference,
+        # Create split transactions. Every field comes from the validated
+        # original or SplitTransaction, so construction skips validation.
+        # Determine amount sign based on original
+        sign = -1 if original.amount < 0 else 1
+        prefix = original.description + " - "
+        original_date = original.date
+        original_type = original.transaction_type
+        original_account = original.account
+        original_reference = original.reference
+        intern = self.repo.intern_category
+        split_transactions = [
+            Transaction.model_construct(
+                date=original_date,
+                amount=sign * abs(split.amount),
+                description=prefix + (split.description or split.category.name),
+                category=intern(split.category),
+                transaction_type=original_type,
+                account=original_account,
+                reference=original_reference,
                 notes=split.description,
-                id=str(uuid.uuid4()),
+                id=split_id,
                 parent_transaction_id=transaction_id,
             )
-            split_transactions.append(split_txn)
+            for split, split_id in zip(splits, _batch_uuids(len(splits)))
+        ]
 
         # Save split transactions
-        self.repo.save(split_transactions)
+        self._write(inserts=split_transactions)
 
         # Optionally delete or mark original as split
         # For now, we'll keep the original but could delete it
@@ -167,28 +264,33 @@ class TransactionEditor:
         if len(transaction_ids) < 2:
             raise ValueError("Need at least 2 transactions to merge")
 
-        transactions = []
-        for txn_id in transaction_ids:
-            txn = self.repo.get_by_id(txn_id)
-            if not txn:
-                raise ValueError(f"Transaction {txn_id} not found")
-            transactions.append(txn)
+        found = self._get_many(transaction_ids)
+        missing = [txn_id for txn_id in transaction_ids if txn_id not in found]
+        if missing:
+            raise ValueError(f"Transactions not found: {', '.join(missing)}")
+
+        transactions = [found[txn_id] for txn_id in transaction_ids]
+        total_amount = Decimal(0)
+        for txn in transactions:
+            total_amount += txn.amount
 
         if keep_first:
-            # Use first transaction as base
-            merged = transactions[0]
-            # Sum amounts
-            total_amount = sum(t.amount for t in transactions)
-            merged = Transaction(
-                **merged.model_dump(),
-                amount=total_amount,
-                description=f"{merged.description} (merged)",
+            # Use first transaction as base; model_copy skips revalidation
+            first = transactions[0]
+            Transaction.validate_amount(total_amount)
+            merged = first.model_copy(
+                update={
+                    "amount": total_amount,
+                    "description": f"{first.description} (merged)",
+                    # New ID so deleting the originals doesn't remove the merge
+                    "id": str(uuid.uuid4()),
+                }
             )
         else:
-            # Combine all details
-            total_amount = sum(t.amount for t in transactions)
+            # Combine all details; inputs are validated stored transactions
+            Transaction.validate_amount(total_amount)
             descriptions = [t.description for t in transactions]
-            merged = Transaction(
+            merged = Transaction.model_construct(
                 date=transactions[0].date,
                 amount=total_amount,
                 description=", ".join(descriptions),
@@ -199,11 +301,8 @@ class TransactionEditor:
                 id=str(uuid.uuid4()),
             )
 
-        # Save merged transaction
-        self.repo.save([merged])
-
-        # Delete original transactions
-        self.repo.delete_multiple(transaction_ids)
+        # Save merged transaction and delete the originals in one write
+        self._write(inserts=[merged], deletes=transaction_ids)
 
         return merged
 
@@ -222,26 +321,141 @@ class TransactionEditor:
             notes: Notes to add (optional)
 
         Returns:
-            Number of transactions updated
+            Number of matching transactions (rows that already had the given
+            values count as updated but are not rewritten)
         """
-        updated_count = 0
+        found = self._get_many(transaction_ids)
+
+        # Fields shared by every row are built once
+        patch = {}
+        if category is not None:
+            category = self.repo.intern_category(category)
+            patch["category"] = category
+
+        updates = []
+        if notes is None:
+            if category is not None:
+                updates = [
+                    transaction.model_copy(update=patch)
+                    for transaction in found.values()
+                    # Loaded categories are pooled, so identity usually decides
+                    if transaction.category is not category
+                    and transaction.category != category
+                ]
+        else:
+            notes_suffix = f"\n{notes}"
+            for transaction in found.values():
+                existing_notes = transaction.notes
+                changes = {
+                    **patch,
+                    "notes": existing_notes + notes_suffix if existing_notes else notes,
+                }
+                updates.append(transaction.model_copy(update=changes))
+
+        # Only rows that actually change are written
+        if updates:
+            self._write(updates=updates)
+        return len(found)
+
+    def _write(
+        self,
+        inserts: Optional[List[Transaction]] = None,
+        updates: Optional[List[Transaction]] = None,
+        deletes: Optional[List[str]] = None,
+    ) -> None:
+        """Write changes to the repository, or buffer them inside a batch."""
+        inserts = inserts or []
+        updates = updates or []
+        deletes = deletes or []
+
+        if self._pending is None:
+            self.repo.apply_changeset(inserts=inserts, updates=updates, deletes=deletes)
+            self._remember(updates)
+            return
+
+        pending = self._pending
+        delete_ids = set(deletes)
+        if delete_ids:
+            # Deleting a buffered insert simply drops it
+            pending["inserts"] = [t for t in pending["inserts"] if t.id not in delete_ids]
+            pending["updates"] = [t for t in pending["updates"] if t.id not in delete_ids]
+            pending["deletes"].extend(delete_ids)
+            for txn_id in delete_ids:
+                self._cache.pop(txn_id, None)
+                self._buffered.pop(txn_id, None)
+
+        inserted_ids = {t.id: i for i, t in enumerate(pending["inserts"])}
+        for transaction in updates:
+            # Updating a buffered insert replaces it, since inserts apply last
+            index = inserted_ids.get(transaction.id)
+            if index is not None:
+                pending["inserts"][index] = transaction
+            else:
+                pending["updates"].append(transaction)
+
+        pending["inserts"].extend(inserts)
+        for transaction in inserts + updates:
+            if transaction.id is not None:
+                self._buffered[transaction.id] = transaction
+        self._cache_put(inserts)
+        self._cache_put(updates)
+
+    def _get(self, transaction_id: str) -> Optional[Transaction]:
+        """Get a transaction by ID, using the lookup cache when possible."""
+        return self._get_many([transaction_id]).get(transaction_id)
+
+    def _get_many(self, transaction_ids: List[str]) -> Dict[str, Transaction]:
+        """Get transactions by ID, fetching only cache misses from the repository."""
+        self._validate_cache()
+
+        deleted = set(self._pending["deletes"]) if self._pending is not None else set()
+        found: Dict[str, Transaction] = {}
+        missing = []
         for txn_id in transaction_ids:
-            transaction = self.repo.get_by_id(txn_id)
-            if not transaction:
+            if txn_id in deleted:
+                continue
+            buffered = self._buffered.get(txn_id)
+            if buffered is not None:
+                found[txn_id] = buffered
                 continue
+            cached = self._cache.get(txn_id)
+            if cached is not None:
+                self._cache.move_to_end(txn_id)
+                found[txn_id] = cached
+            else:
+                missing.append(txn_id)
 
-            updated_data = transaction.model_dump()
-            if category is not None:
-                updated_data["category"] = category
-            if notes is not None:
-                existing_notes = updated_data.get("notes", "")
-                updated_data["notes"] = (
-                    f"{existing_notes}\n{notes}" if existing_notes else notes
-                )
-
-            updated = Transaction(**updated_data)
-            if self.repo.update(updated):
-                updated_count += 1
-
-        return updated_count
+        if missing:
+            fetched = self.repo.get_many(missing)
+            found.update(fetched)
+            self._cache_put(fetched.values())
+
+        return found
+
+    def _remember(self, transactions: List[Transaction]) -> None:
+        """
+        Reset the cache after a write, keeping only the transactions just written.
+
+        Anything else may have been changed by the write, so it is dropped.
+        """
+        self._cache.clear()
+        self._cache_version = self.repo.data_version()
+        self._cache_put(transactions)
+
+    def _validate_cache(self) -> None:
+        """Drop cached transactions if storage changed since they were read."""
+        if self._pending is not None:
+            return  # Checked when the batch started; buffered rows are in _buffered
+        version = self.repo.data_version()
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+
+    def _cache_put(self, transactions) -> None:
+        """Add transactions to the cache, evicting the least recently used."""
+        for transaction in transactions:
+            self._cache[transaction.id] = transaction
+            self._cache.move_to_end(transaction.id)
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
 
@@ -31,19 +31,34 @@ Or from command line:
     $ finance-tracker-web
 """
 
+import functools
 import logging
+import socket
 import subprocess
 import sys
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, cast
 
 import eel
+import gevent
 
+from finance_tracker.analyzer import SpendingAnalyzer
 from finance_tracker.budget_tracker import BudgetRepository, BudgetTracker
 from finance_tracker.category_rules_manager import CategoryRulesManager
 from finance_tracker.config import get_config
 from finance_tracker.logging_config import setup_logging
-from finance_tracker.models import Budget, BudgetTemplate, Category, SplitTransaction
+from finance_tracker.models import (
+    Budget,
+    BudgetTemplate,
+    Category,
+    SplitTransaction,
+    Transaction,
+)
 from finance_tracker.recurring_detector import RecurringTransactionDetector
 from finance_tracker.search_filter import TransactionSearchFilter
 from finance_tracker.transaction_editor import TransactionEditor
@@ -55,16 +70,208 @@ logger = logging.getLogger(__name__)
 workflow: Optional[FinanceTrackerWorkflow] = None
 
 
+
+class _TransactionViews:
+    """Views derived from the workflow's cached transaction list."""
+
+    def __init__(self) -> None:
+        self.txns: Optional[List[Transaction]] = None
+        self.by_date: Optional[List[Transaction]] = None
+        self.by_date_dicts: Optional[List[Optional[Dict]]] = None
+        self.budget_tracker: Optional[BudgetTracker] = None
+        self.searcher: Optional[TransactionSearchFilter] = None
+
+    def reset(self, txns: Optional[List[Transaction]] = None) -> None:
+        """Drop all derived views, keeping txns as the list they derive from."""
+        self.txns = txns
+        self.by_date = None
+        self.by_date_dicts = None
+        self.budget_tracker = None
+        self.searcher = None
+
+
+# Views over the workflow's transactions, rebuilt whenever the workflow hands
+# out a different list
+_txn_cache = _TransactionViews()
+
+# Guards every read, refresh and invalidation of _txn_cache: endpoints on
+# gevent's thread pool update it while greenlets on the hub thread read it
+_txn_cache_lock = threading.RLock()
+
+# Budget repository for the current workflow's data directory
+_budget_repo: Optional[BudgetRepository] = None
+
+# Category rules manager for the current workflow's data directory
+_rules_manager: Optional[CategoryRulesManager] = None
+
+# Export directory for the current workflow, created by init_workflow
+_export_dir: Optional[Path] = None
+
+# Guards lazy workflow initialization against concurrent first calls
+_init_lock = threading.Lock()
+
+# Hidden Tk root reused by file dialogs on non-macOS platforms
+_tk_root = None
+
+
 def init_workflow(data_dir: Optional[Path] = None) -> None:
     """Initialize the workflow instance."""
-    global workflow
+    global workflow, _budget_repo, _rules_manager, _export_dir
     cfg = get_config()
     if data_dir is None:
         data_dir = Path(cfg.get("data.directory", Path.home() / ".finance-tracker"))
-    workflow = FinanceTrackerWorkflow(data_dir=data_dir)
+    new_workflow = FinanceTrackerWorkflow(data_dir=data_dir)
+    _budget_repo = None
+    _rules_manager = None
+    _export_dir = new_workflow.storage.data_dir / "exports"
+    _export_dir.mkdir(exist_ok=True)
+    _invalidate_transaction_cache()
+    # Publish last so endpoints never see a half-initialized workflow
+    workflow = new_workflow
     logger.info(f"Initialized workflow with data directory: {data_dir}")
 
 
+def _require_workflow(fn):
+    """Decorate an endpoint so the workflow is initialized before it runs."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if workflow is None:
+            _ensure_workflow()
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def _ensure_workflow() -> None:
+    """Initialize the workflow unless another caller already has."""
+    with _init_lock:
+        if workflow is None:
+            init_workflow()
+
+
+def _run_in_threadpool(fn):
+    """
+    Decorate a long-running endpoint to run on gevent's native thread pool.
+
+    Eel serves every RPC from greenlets on one thread, so a slow endpoint
+    would otherwise hold up all other calls until it returns.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+
+    return wrapper
+
+
+def _load_all_cached() -> List[Transaction]:
+    """
+    Load all stored transactions, skipping the parse if storage is unchanged.
+
+    Returns:
+        New list of transactions (safe to sort in place)
+    """
+    with _txn_cache_lock:
+        return list(_refresh_transaction_cache())
+
+
+def _load_sorted_by_date() -> List[Transaction]:
+    """
+    Load all stored transactions newest first, sorting once per storage version.
+
+    Returns:
+        Shared sorted list; callers must not modify it
+    """
+    with _txn_cache_lock:
+        transactions = _refresh_transaction_cache()
+        by_date = _txn_cache.by_date
+        if by_date is None:
+            # The repository writes newest first; only stores saved by older
+            # versions still need sorting here
+            if all(a.date >= b.date for a, b in zip(transactions, islice(transactions, 1, None))):
+                by_date = transactions
+            else:
+                by_date = sorted(transactions, key=lambda t: t.date, reverse=True)
+            _txn_cache.by_date = by_date
+        return by_date
+
+
+def _refresh_transaction_cache() -> List[Transaction]:
+    """
+    Drop derived views if the workflow reloaded transactions from storage.
+
+    Returns:
+        The workflow's shared transaction list; callers must not modify it
+    """
+    wf = workflow
+    assert wf is not None
+    with _txn_cache_lock:
+        # The workflow caches one load per storage version
+        transactions = wf.load_transactions()
+        if _txn_cache.txns is not transactions:
+            _txn_cache.reset(transactions)
+        return transactions
+
+
+def _get_budget_repo() -> BudgetRepository:
+    """Get the budget repository for the current workflow."""
+    global _budget_repo
+    if _budget_repo is None:
+        _budget_repo = BudgetRepository(workflow.storage.data_dir)
+    return _budget_repo
+
+
+def _get_analyzer() -> SpendingAnalyzer:
+    """Get the workflow's spending analyzer, shared until transactions change."""
+    return workflow.analyze_spending()
+
+
+def _get_searcher() -> TransactionSearchFilter:
+    """Get a search filter over the stored transactions, keeping its indexes until they change."""
+    with _txn_cache_lock:
+        transactions = _refresh_transaction_cache()
+        searcher = _txn_cache.searcher
+        if searcher is None:
+            searcher = _txn_cache.searcher = TransactionSearchFilter(transactions)
+        return searcher
+
+
+def _get_rules_manager() -> CategoryRulesManager:
+    """
+    Get the category rules manager for the current workflow.
+
+    The manager keeps its compiled rules in memory and writes every change
+    through to disk, so one instance serves all rule endpoints.
+    """
+    global _rules_manager
+    if _rules_manager is None:
+        _rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+    return _rules_manager
+
+
+def _get_budget_tracker() -> BudgetTracker:
+    """
+    Get a budget tracker over the stored transactions.
+
+    The tracker is rebuilt only when transactions change; budgets themselves
+    are read from the repository on every query, so budget edits need no
+    invalidation.
+    """
+    with _txn_cache_lock:
+        transactions = _refresh_transaction_cache()
+        tracker = _txn_cache.budget_tracker
+        if tracker is None:
+            tracker = _txn_cache.budget_tracker = BudgetTracker(transactions, _get_budget_repo())
+        return tracker
+
+
+def _invalidate_transaction_cache() -> None:
+    """Force derived views to be rebuilt on next use."""
+    with _txn_cache_lock:
+        _txn_cache.reset()
+
+
 @eel.expose
 def select_file() -> Optional[str]:
     """
@@ -74,25 +281,54 @@ def select_file() -> Optional[str]:
         Selected file path or None
     """
     try:
-        import tkinter as tk
+        if sys.platform == "darwin":
+            # Native picker; avoids starting a Tk interpreter per call
+            result = subprocess.run(
+                [
+                    "osascript",
+                    "-e",
+                    'POSIX path of (choose file with prompt "Select CSV File")',
+                ],
+                capture_output=True,
+                text=True,
+                timeout=300,
+            )
+            # A cancelled dialog exits non-zero with no path
+            return result.stdout.strip() or None
+
         from tkinter import filedialog
-        
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        
+
         file_path = filedialog.askopenfilename(
+            parent=_get_tk_root(),
             title="Select CSV File",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
-        root.destroy()
         return file_path if file_path else None
     except Exception as e:
         logger.error(f"Error selecting file: {e}", exc_info=True)
         return None
 
 
+def _get_tk_root():
+    """
+    Get the hidden Tk root for file dialogs, starting Tcl on first use only.
+
+    The root stays alive between dialogs; select_file always runs on the
+    main thread, which Tk requires.
+    """
+    global _tk_root
+    if _tk_root is None:
+        import tkinter as tk
+
+        _tk_root = tk.Tk()
+        _tk_root.withdraw()  # Hide the main window
+    return _tk_root
+
+
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
 def import_csv_file(
     file_path: str,
     account: Optional[str] = None,
@@ -115,9 +351,6 @@ def import_csv_file(
     Returns:
         Dictionary with import statistics
     """
-    if workflow is None:
-        init_workflow()
-
     try:
         csv_path = Path(file_path)
         if not csv_path.exists():
@@ -130,6 +363,7 @@ def import_csv_file(
             check_duplicates=check_duplicates,
             skip_duplicates=skip_duplicates,
         )
+        _invalidate_transaction_cache()
 
         return {
             "success": True,
@@ -144,6 +378,59 @@ def import_csv_file(
 
 
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
+def import_csv_files(
+    file_paths: List[str],
+    auto_categorize: bool = True,
+    overwrite: bool = False,
+    check_duplicates: bool = True,
+    skip_duplicates: bool = True,
+) -> Dict:
+    """
+    Import several CSV files with a single storage write.
+
+    Args:
+        file_paths: Paths to CSV files
+        auto_categorize: Whether to auto-categorize
+        overwrite: Whether to overwrite existing categories
+        check_duplicates: Whether to check for duplicates
+        skip_duplicates: Whether to skip duplicates
+
+    Returns:
+        Dictionary with import statistics summed over the files
+    """
+    try:
+        csv_paths = [Path(file_path) for file_path in file_paths]
+        missing = [str(path) for path in csv_paths if not path.exists()]
+        if missing:
+            raise FileNotFoundError(f"Files not found: {', '.join(missing)}")
+
+        wf = workflow
+        assert wf is not None
+        transactions, stats = wf.process_csv_files(
+            csv_paths,
+            auto_categorize=auto_categorize,
+            overwrite_categories=overwrite,
+            check_duplicates=check_duplicates,
+            skip_duplicates=skip_duplicates,
+        )
+        _invalidate_transaction_cache()
+
+        return {
+            "success": True,
+            "new_transactions": stats["new_transactions"],
+            "duplicates_found": stats.get("duplicates_found", 0),
+            "categorized": stats.get("categorized", 0),
+            "categorization_rate": stats.get("categorization_rate", 0),
+        }
+    except Exception as e:
+        logger.error(f"Error importing CSV files: {e}", exc_info=True)
+        return {"success": False, "error": str(e)}
+
+
+@eel.expose
+@_require_workflow
 def get_transactions(page: int = 1, per_page: int = 50) -> List[Dict]:
     """
     Get paginated transactions.
@@ -155,49 +442,47 @@ def get_transactions(page: int = 1, per_page: int = 50) -> List[Dict]:
     Returns:
         List of transaction dictionaries
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        
-        # Sort by date (newest first)
-        transactions.sort(key=lambda t: t.date, reverse=True)
-        
-        # Paginate
-        start = (page - 1) * per_page
-        end = start + per_page
-        page_transactions = transactions[start:end]
-        
-        # Convert to dictionaries
-        result = []
-        for txn in page_transactions:
-            txn_dict = {
-                "date": txn.date.isoformat(),
-                "description": txn.description,
-                "amount": str(txn.amount),
-                "transaction_type": txn.transaction_type.value,
-                "category": None,
-            }
-            if txn.category:
-                txn_dict["category"] = {
-                    "name": txn.category.name,
-                    "parent": txn.category.parent,
-                }
-            if txn.account:
-                txn_dict["account"] = txn.account
-            if txn.balance is not None:
-                txn_dict["balance"] = str(txn.balance)
-            
-            result.append(txn_dict)
-        
-        return result
+        with _txn_cache_lock:
+            # Sorted by date (newest first) once per storage version
+            transactions = _load_sorted_by_date()
+            dicts = _txn_cache.by_date_dicts
+            if dicts is None:
+                dicts = _txn_cache.by_date_dicts = [None] * len(transactions)
+
+            # Paginate; rows are converted on first view and reused until the
+            # next write
+            start = max(page - 1, 0) * per_page
+            end = min(start + per_page, len(transactions))
+            for i in range(start, end):
+                if dicts[i] is None:
+                    dicts[i] = _transaction_to_dict(transactions[i])
+
+            return cast(List[Dict], dicts[start:end])
     except Exception as e:
         logger.error(f"Error getting transactions: {e}", exc_info=True)
         return []
 
 
 @eel.expose
+@_require_workflow
+def get_transactions_count() -> int:
+    """
+    Get the number of stored transactions, for pagination.
+
+    Returns:
+        Total transaction count
+    """
+    try:
+        with _txn_cache_lock:
+            return len(_refresh_transaction_cache())
+    except Exception as e:
+        logger.error(f"Error counting transactions: {e}", exc_info=True)
+        return 0
+
+
+@eel.expose
+@_require_workflow
 def get_overall_stats() -> Dict:
     """
     Get overall statistics.
@@ -205,14 +490,10 @@ def get_overall_stats() -> Dict:
     Returns:
         Dictionary with overall statistics
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        analyzer = workflow.analyze_spending()
-        total_income = analyzer.get_total_income()
-        total_expenses = analyzer.get_total_expenses()
-        net_amount = analyzer.get_net_amount()
+        analyzer = _get_analyzer()
+        total_income, total_expenses = analyzer.get_totals()
+        net_amount = total_income - total_expenses
         
         savings_rate = None
         if total_income > 0:
@@ -235,6 +516,7 @@ def get_overall_stats() -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def get_monthly_summaries() -> List[Dict]:
     """
     Get all monthly summaries.
@@ -242,11 +524,8 @@ def get_monthly_summaries() -> List[Dict]:
     Returns:
         List of monthly summary dictionaries
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        analyzer = workflow.analyze_spending()
+        analyzer = _get_analyzer()
         summaries = analyzer.get_all_monthly_summaries()
         
         result = []
@@ -271,6 +550,7 @@ def get_monthly_summaries() -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
 def get_category_breakdown() -> Dict[str, str]:
     """
     Get category breakdown.
@@ -278,11 +558,8 @@ def get_category_breakdown() -> Dict[str, str]:
     Returns:
         Dictionary mapping category names to total amounts
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        analyzer = workflow.analyze_spending()
+        analyzer = _get_analyzer()
         breakdown = analyzer.get_category_breakdown()
         return {k: str(v) for k, v in breakdown.items()}
     except Exception as e:
@@ -291,6 +568,34 @@ def get_category_breakdown() -> Dict[str, str]:
 
 
 @eel.expose
+@_require_workflow
+def get_dashboard_bundle(page: int = 1, per_page: int = 50) -> Dict:
+    """
+    Get all dashboard data in one call.
+
+    The individual endpoints are kept for callers that need only one part.
+
+    Args:
+        page: Page of transactions to include
+        per_page: Number of transactions per page
+
+    Returns:
+        Dictionary with "stats", "monthly_summaries", "category_breakdown",
+        "spending_patterns", "transactions" and "transactions_count" in the
+        same shapes as the individual endpoints
+    """
+    return {
+        "stats": get_overall_stats(),
+        "monthly_summaries": get_monthly_summaries(),
+        "category_breakdown": get_category_breakdown(),
+        "spending_patterns": get_spending_patterns(),
+        "transactions": get_transactions(page, per_page),
+        "transactions_count": get_transactions_count(),
+    }
+
+
+@eel.expose
+@_require_workflow
 def get_spending_patterns() -> List[Dict]:
     """
     Get spending patterns for all categories.
@@ -298,13 +603,13 @@ def get_spending_patterns() -> List[Dict]:
     Returns:
         List of spending pattern dictionaries
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        analyzer = workflow.analyze_spending()
+        analyzer = _get_analyzer()
         patterns = analyzer.get_spending_patterns()
-        
+
+        # Sort by total amount descending (Decimal compare, no string parsing)
+        patterns = sorted(patterns, key=lambda p: p.total_amount, reverse=True)
+
         result = []
         for pattern in patterns:
             result.append({
@@ -317,10 +622,7 @@ def get_spending_patterns() -> List[Dict]:
                 "percentage_of_total": pattern.percentage_of_total,
                 "trend": pattern.trend,
             })
-        
-        # Sort by total amount descending
-        result.sort(key=lambda p: float(p["total_amount"]), reverse=True)
-        
+
         return result
     except Exception as e:
         logger.error(f"Error getting spending patterns: {e}", exc_info=True)
@@ -328,6 +630,8 @@ def get_spending_patterns() -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
 def export_transactions() -> str:
     """
     Export transactions to JSON file.
@@ -335,17 +639,10 @@ def export_transactions() -> str:
     Returns:
         Path to exported file
     """
-    if workflow is None:
-        init_workflow()
-
     try:
-        from datetime import datetime
-        
-        export_dir = workflow.storage.data_dir / "exports"
-        export_dir.mkdir(exist_ok=True)
-        
+        assert _export_dir is not None
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        export_file = export_dir / f"transactions_{timestamp}.json"
+        export_file = _export_dir / f"transactions_{timestamp}.json"
         
         workflow.storage.export_transactions_json(export_file)
         
@@ -356,6 +653,8 @@ def export_transactions() -> str:
 
 
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
 def recategorize_all(overwrite: bool = True) -> Dict:
     """
     Recategorize all transactions.
@@ -366,11 +665,9 @@ def recategorize_all(overwrite: bool = True) -> Dict:
     Returns:
         Dictionary with recategorization statistics
     """
-    if workflow is None:
-        init_workflow()
-
     try:
         stats = workflow.recategorize_all(overwrite=overwrite)
+        _invalidate_transaction_cache()
         return {
             "success": True,
             "total": stats["total"],
@@ -385,6 +682,7 @@ def recategorize_all(overwrite: bool = True) -> Dict:
 
 # Transaction Editing Endpoints
 @eel.expose
+@_require_workflow
 def edit_transaction(
     transaction_id: str,
     description: Optional[str] = None,
@@ -395,13 +693,7 @@ def edit_transaction(
     notes: Optional[str] = None,
 ) -> Dict:
     """Edit a transaction."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        from datetime import datetime
-        from decimal import Decimal
-
         editor = TransactionEditor(workflow.storage.transaction_repo)
         category = None
         if category_name:
@@ -423,6 +715,7 @@ def edit_transaction(
             category=category,
             notes=notes,
         )
+        _invalidate_transaction_cache()
 
         if updated:
             return {"success": True, "transaction": _transaction_to_dict(updated)}
@@ -433,14 +726,13 @@ def edit_transaction(
 
 
 @eel.expose
+@_require_workflow
 def delete_transaction(transaction_id: str) -> Dict:
     """Delete a transaction."""
-    if workflow is None:
-        init_workflow()
-
     try:
         editor = TransactionEditor(workflow.storage.transaction_repo)
         success = editor.delete_transaction(transaction_id)
+        _invalidate_transaction_cache()
         return {"success": success}
     except Exception as e:
         logger.error(f"Error deleting transaction: {e}", exc_info=True)
@@ -448,14 +740,13 @@ def delete_transaction(transaction_id: str) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def delete_transactions(transaction_ids: List[str]) -> Dict:
     """Delete multiple transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
         editor = TransactionEditor(workflow.storage.transaction_repo)
         count = editor.delete_multiple(transaction_ids)
+        _invalidate_transaction_cache()
         return {"success": True, "deleted_count": count}
     except Exception as e:
         logger.error(f"Error deleting transactions: {e}", exc_info=True)
@@ -463,14 +754,10 @@ def delete_transactions(transaction_ids: List[str]) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def split_transaction(transaction_id: str, splits: List[Dict]) -> Dict:
     """Split a transaction into multiple transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        from decimal import Decimal
-
         editor = TransactionEditor(workflow.storage.transaction_repo)
         split_list = []
         for split_data in splits:
@@ -487,6 +774,7 @@ def split_transaction(transaction_id: str, splits: List[Dict]) -> Dict:
             )
 
         split_transactions = editor.split_transaction(transaction_id, split_list)
+        _invalidate_transaction_cache()
         return {
             "success": True,
             "transactions": [_transaction_to_dict(t) for t in split_transactions],
@@ -497,14 +785,13 @@ def split_transaction(transaction_id: str, splits: List[Dict]) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def merge_transactions(transaction_ids: List[str], keep_first: bool = True) -> Dict:
     """Merge multiple transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
         editor = TransactionEditor(workflow.storage.transaction_repo)
         merged = editor.merge_transactions(transaction_ids, keep_first)
+        _invalidate_transaction_cache()
         if merged:
             return {"success": True, "transaction": _transaction_to_dict(merged)}
         return {"success": False, "error": "Failed to merge"}
@@ -514,13 +801,11 @@ def merge_transactions(transaction_ids: List[str], keep_first: bool = True) -> D
 
 
 @eel.expose
+@_require_workflow
 def bulk_edit_transactions(
     transaction_ids: List[str], category_name: Optional[str] = None, notes: Optional[str] = None
 ) -> Dict:
     """Bulk edit transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
         editor = TransactionEditor(workflow.storage.transaction_repo)
         category = None
@@ -528,6 +813,7 @@ def bulk_edit_transactions(
             category = Category(name=category_name)
 
         count = editor.bulk_edit(transaction_ids, category=category, notes=notes)
+        _invalidate_transaction_cache()
         return {"success": True, "updated_count": count}
     except Exception as e:
         logger.error(f"Error bulk editing: {e}", exc_info=True)
@@ -536,6 +822,7 @@ def bulk_edit_transactions(
 
 # Search & Filter Endpoints
 @eel.expose
+@_require_workflow
 def search_transactions(
     query: Optional[str] = None,
     category: Optional[str] = None,
@@ -548,40 +835,17 @@ def search_transactions(
     is_recurring: Optional[bool] = None,
 ) -> List[Dict]:
     """Search and filter transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        from datetime import datetime
-        from decimal import Decimal
-
-        transactions = workflow.storage.transaction_repo.load_all()
-        searcher = TransactionSearchFilter(transactions)
-
-        date_from_obj = None
-        if date_from:
-            date_from_obj = datetime.fromisoformat(date_from).date()
-
-        date_to_obj = None
-        if date_to:
-            date_to_obj = datetime.fromisoformat(date_to).date()
-
-        amount_min_obj = None
-        if amount_min:
-            amount_min_obj = Decimal(amount_min)
-
-        amount_max_obj = None
-        if amount_max:
-            amount_max_obj = Decimal(amount_max)
+        searcher = _get_searcher()
 
         results = searcher.search(
             query=query,
             category=category,
             account=account,
-            date_from=date_from_obj,
-            date_to=date_to_obj,
-            amount_min=amount_min_obj,
-            amount_max=amount_max_obj,
+            date_from=_parse_date(date_from),
+            date_to=_parse_date(date_to),
+            amount_min=_parse_decimal(amount_min),
+            amount_max=_parse_decimal(amount_max),
             transaction_type=transaction_type,
             is_recurring=is_recurring,
         )
@@ -593,14 +857,11 @@ def search_transactions(
 
 
 @eel.expose
+@_require_workflow
 def get_search_filters() -> Dict:
     """Get available filter options."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        searcher = TransactionSearchFilter(transactions)
+        searcher = _get_searcher()
         return {
             "categories": searcher.get_categories(),
             "accounts": searcher.get_accounts(),
@@ -612,6 +873,7 @@ def get_search_filters() -> Dict:
 
 # Budget Tracking Endpoints
 @eel.expose
+@_require_workflow
 def set_budget(
     category_name: str,
     year: int,
@@ -621,13 +883,8 @@ def set_budget(
     notes: Optional[str] = None,
 ) -> Dict:
     """Set a budget for a category."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        from decimal import Decimal
-
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
+        budget_repo = _get_budget_repo()
         budget = Budget(
             category_name=category_name,
             year=year,
@@ -644,15 +901,11 @@ def set_budget(
 
 
 @eel.expose
+@_require_workflow
 def get_budget_status(category_name: str, year: int, month: int) -> Dict:
     """Get budget status for a category."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
-        tracker = BudgetTracker(transactions, budget_repo)
+        tracker = _get_budget_tracker()
         status = tracker.get_budget_status(category_name, year, month)
         return status
     except Exception as e:
@@ -661,15 +914,11 @@ def get_budget_status(category_name: str, year: int, month: int) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def get_all_budget_statuses(year: int, month: int) -> List[Dict]:
     """Get all budget statuses for a month."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
-        tracker = BudgetTracker(transactions, budget_repo)
+        tracker = _get_budget_tracker()
         return tracker.get_all_budget_statuses(year, month)
     except Exception as e:
         logger.error(f"Error getting budget statuses: {e}", exc_info=True)
@@ -677,15 +926,11 @@ def get_all_budget_statuses(year: int, month: int) -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
 def get_budget_alerts(year: int, month: int) -> List[Dict]:
     """Get budget alerts for a month."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
-        tracker = BudgetTracker(transactions, budget_repo)
+        tracker = _get_budget_tracker()
         return tracker.check_alerts(year, month)
     except Exception as e:
         logger.error(f"Error getting budget alerts: {e}", exc_info=True)
@@ -693,13 +938,11 @@ def get_budget_alerts(year: int, month: int) -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
 def delete_budget(category_name: str, year: int, month: int) -> Dict:
     """Delete a budget."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
+        budget_repo = _get_budget_repo()
         success = budget_repo.delete_budget(category_name, year, month)
         return {"success": success}
     except Exception as e:
@@ -708,15 +951,11 @@ def delete_budget(category_name: str, year: int, month: int) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def save_budget_template(name: str, category_budgets: Dict, description: Optional[str] = None) -> Dict:
     """Save a budget template."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        from decimal import Decimal
-
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
+        budget_repo = _get_budget_repo()
         template = BudgetTemplate(
             name=name,
             category_budgets={k: Decimal(v) for k, v in category_budgets.items()},
@@ -730,13 +969,11 @@ def save_budget_template(name: str, category_budgets: Dict, description: Optiona
 
 
 @eel.expose
+@_require_workflow
 def get_budget_templates() -> List[Dict]:
     """Get all budget templates."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        budget_repo = BudgetRepository(workflow.storage.data_dir)
+        budget_repo = _get_budget_repo()
         templates = budget_repo.load_templates()
         return [
             {
@@ -753,13 +990,12 @@ def get_budget_templates() -> List[Dict]:
 
 # Recurring Transaction Endpoints
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
 def detect_recurring_transactions(min_occurrences: int = 3) -> List[Dict]:
     """Detect recurring transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
+        transactions = _load_all_cached()
         detector = RecurringTransactionDetector(transactions)
         recurring = detector.detect_recurring(min_occurrences)
         return [
@@ -783,17 +1019,17 @@ def detect_recurring_transactions(min_occurrences: int = 3) -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
+@_run_in_threadpool
 def mark_recurring_transactions() -> Dict:
     """Mark transactions as recurring based on detected patterns."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
+        transactions = _load_all_cached()
         detector = RecurringTransactionDetector(transactions)
         recurring = detector.detect_recurring()
         updated = detector.mark_recurring(recurring)
-        workflow.storage.transaction_repo._save_all(updated)
+        workflow.storage.transaction_repo.replace_all(updated)
+        _invalidate_transaction_cache()
         return {"success": True, "marked_count": len([t for t in updated if t.is_recurring])}
     except Exception as e:
         logger.error(f"Error marking recurring: {e}", exc_info=True)
@@ -802,13 +1038,11 @@ def mark_recurring_transactions() -> Dict:
 
 # Category Rules Management Endpoints
 @eel.expose
+@_require_workflow
 def get_category_rules() -> List[Dict]:
     """Get all category rules."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+        rules_manager = _get_rules_manager()
         return rules_manager.get_all_rules()
     except Exception as e:
         logger.error(f"Error getting rules: {e}", exc_info=True)
@@ -816,6 +1050,7 @@ def get_category_rules() -> List[Dict]:
 
 
 @eel.expose
+@_require_workflow
 def add_category_rule(
     pattern: str,
     category_name: str,
@@ -823,11 +1058,8 @@ def add_category_rule(
     case_sensitive: bool = False,
 ) -> Dict:
     """Add a category rule."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+        rules_manager = _get_rules_manager()
         success = rules_manager.add_rule(pattern, category_name, parent_category, case_sensitive)
         return {"success": success}
     except Exception as e:
@@ -836,13 +1068,11 @@ def add_category_rule(
 
 
 @eel.expose
+@_require_workflow
 def remove_category_rule(pattern: str, category_name: str) -> Dict:
     """Remove a category rule."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+        rules_manager = _get_rules_manager()
         success = rules_manager.remove_rule(pattern, category_name)
         return {"success": success}
     except Exception as e:
@@ -851,13 +1081,11 @@ def remove_category_rule(pattern: str, category_name: str) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def test_category_rule(pattern: str, test_strings: List[str]) -> Dict:
     """Test a category rule pattern."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+        rules_manager = _get_rules_manager()
         return rules_manager.test_rule(pattern, test_strings)
     except Exception as e:
         logger.error(f"Error testing rule: {e}", exc_info=True)
@@ -865,43 +1093,98 @@ def test_category_rule(pattern: str, test_strings: List[str]) -> Dict:
 
 
 @eel.expose
+@_require_workflow
 def test_rule_against_transactions(pattern: str, limit: int = 10) -> List[Dict]:
     """Test rule against existing transactions."""
-    if workflow is None:
-        init_workflow()
-
     try:
-        transactions = workflow.storage.transaction_repo.load_all()
-        rules_manager = CategoryRulesManager(workflow.storage.data_dir)
+        transactions = _load_all_cached()
+        rules_manager = _get_rules_manager()
         return rules_manager.test_against_transactions(pattern, transactions, limit)
     except Exception as e:
         logger.error(f"Error testing rule: {e}", exc_info=True)
         return []
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse an ISO date filter from the UI, or None if empty."""
+    return datetime.fromisoformat(value).date() if value else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_decimal(value: Optional[str]) -> Optional[Decimal]:
+    """Parse an amount filter from the UI, or None if empty."""
+    return Decimal(value) if value else None
+
+
 def _transaction_to_dict(transaction) -> Dict:
-    """Helper to convert transaction to dictionary."""
-    result = {
+    """
+    Helper to convert transaction to dictionary.
+
+    Every key is always present (None when unset) so all rows share one shape.
+    """
+    category = transaction.category
+    balance = transaction.balance
+    return {
         "id": transaction.id,
         "date": transaction.date.isoformat(),
         "description": transaction.description,
         "amount": str(transaction.amount),
         "transaction_type": transaction.transaction_type.value,
-        "category": None,
+        "category": _category_to_dict(category) if category else None,
+        "account": transaction.account or None,
+        "notes": transaction.notes or None,
+        "balance": str(balance) if balance is not None else None,
         "is_recurring": transaction.is_recurring,
     }
-    if transaction.category:
-        result["category"] = {
-            "name": transaction.category.name,
-            "parent": transaction.category.parent,
-        }
-    if transaction.account:
-        result["account"] = transaction.account
-    if transaction.notes:
-        result["notes"] = transaction.notes
-    if transaction.balance is not None:
-        result["balance"] = str(transaction.balance)
-    return result
+
+
+def _category_to_dict(category: Category) -> Dict:
+    """Helper to convert category to dictionary."""
+    return {"name": category.name, "parent": category.parent}
+
+
+def _choose_port(preferred: int) -> int:
+    """
+    Pick the port for the web server, falling back to one chosen by the OS.
+
+    SO_REUSEADDR is deliberately not set: on macOS it can let the probe bind
+    next to an existing listener and report a busy port as free. A port left
+    in TIME_WAIT by a previous run therefore falls back to an ephemeral port.
+
+    Args:
+        preferred: Port to use if it can be bound
+
+    Returns:
+        The preferred port, or a free ephemeral port if it is in use
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(("localhost", preferred))
+        except OSError:
+            sock.bind(("localhost", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def _wait_for_port(port: int, timeout: float = 5.0) -> bool:
+    """
+    Wait until a local server accepts connections on a port.
+
+    Args:
+        port: Port to probe
+        timeout: Maximum number of seconds to wait
+
+    Returns:
+        True if the port accepted a connection before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(("localhost", port)) == 0:
+                return True
+        time.sleep(0.05)
+    return False
 
 
 def start_web_app(port: int = 8080, size: tuple = (1200, 800)) -> None:
@@ -915,9 +1198,6 @@ def start_web_app(port: int = 8080, size: tuple = (1200, 800)) -> None:
     # Setup logging
     setup_logging(level="INFO")
     
-    # Initialize workflow
-    init_workflow()
-    
     # Get web directory
     web_dir = Path(__file__).parent.parent / "web"
     
@@ -926,6 +1206,10 @@ def start_web_app(port: int = 8080, size: tuple = (1200, 800)) -> None:
     
     # Start Eel
     eel.init(str(web_dir))
+
+    # Load the workflow in the background so the server binds immediately;
+    # endpoints called before it finishes wait on the same lock
+    threading.Thread(target=_ensure_workflow, daemon=True).start()
     
     # Configure for Microsoft Edge on macOS
     edge_path = "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"
@@ -936,37 +1220,24 @@ def start_web_app(port: int = 8080, size: tuple = (1200, 800)) -> None:
             # For macOS, we need to manually launch Edge since Eel's edge mode is Windows-only
             logger.info(f"Using Microsoft Edge at {edge_path}")
             
-            # Check if port is available, if not try next port
-            import socket
-            def is_port_available(port_num):
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    return s.connect_ex(('localhost', port_num)) != 0
-            
-            actual_port = port
-            if not is_port_available(port):
-                # Try next few ports
-                for p in range(port, port + 10):
-                    if is_port_available(p):
-                        actual_port = p
-                        logger.info(f"Port {port} in use, using port {actual_port} instead")
-                        break
-                else:
-                    logger.error(f"Could not find available port starting from {port}")
-                    return
-            
-            # Launch Edge after a short delay to allow server to start
-            import threading
-            import time
+            actual_port = _choose_port(port)
+            if actual_port != port:
+                logger.info(f"Port {port} in use, using port {actual_port} instead")
             
+            # Launch Edge once the server accepts connections
             def launch_edge_delayed():
-                time.sleep(1.5)  # Wait for server to start
+                if not _wait_for_port(actual_port):
+                    logger.warning(f"Server not accepting connections on port {actual_port} yet")
                 url = f"http://localhost:{actual_port}/index.html"
                 logger.info(f"Launching Edge with URL: {url}")
+                # No pipes and close_fds=False let CPython use posix_spawn
+                # instead of fork+exec; our own fds are non-inheritable anyway
                 subprocess.Popen(
                     [edge_path, "--new-window", url],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
-                    stdin=subprocess.PIPE
+                    stdin=subprocess.DEVNULL,
+                    close_fds=False,
                 )
             
             # Launch Edge in background thread
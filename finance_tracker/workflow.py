@@ -38,11 +38,16 @@ Example:
 """
 
 import logging
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from finance_tracker.analyzer import SpendingAnalyzer
-from finance_tracker.categorizer import TransactionCategorizer, categorize_transactions
+from finance_tracker.categorizer import (
+    CategorizationStats,
+    TransactionCategorizer,
+    categorize_transactions,
+)
 from finance_tracker.csv_parser import CSVParser, parse_csv
 from finance_tracker.models import Transaction
 from finance_tracker.storage import StorageManager
@@ -65,6 +70,12 @@ class FinanceTrackerWorkflow:
         self.account = account
         self.parser = CSVParser(account=account)
         self.categorizer = TransactionCategorizer()
+        # Stored transactions and analyzer, valid for one repository version.
+        # The web app reads them from several threads, hence the lock.
+        self._cache_lock = threading.RLock()
+        self._txn_cache: Optional[List[Transaction]] = None
+        self._txn_cache_version: Optional[Tuple[int, int, int]] = None
+        self._analyzer_cache: Optional[SpendingAnalyzer] = None
 
     def process_csv_file(
         self,
@@ -88,34 +99,134 @@ class FinanceTrackerWorkflow:
             Tuple of (processed transactions, statistics dict)
         """
         logger.info(f"Processing CSV file: {csv_file}")
+        transactions, duplicates, stats = self._prepare_csv_file(
+            csv_file, auto_categorize, overwrite_categories, check_duplicates, skip_duplicates
+        )
 
+        # Save to storage
+        logger.info("Saving transactions to storage...")
+        counts = self.storage.transaction_repo.apply_changeset(inserts=transactions)
+        logger.info(f"Saved {counts['inserted']} transactions")
+
+        # Prepare statistics; duplicates that were not skipped are already
+        # counted in transactions
+        duplicates_skipped = len(duplicates) if skip_duplicates else 0
+        result_stats: Dict[str, float] = {
+            "total_parsed": len(transactions) + duplicates_skipped,
+            "new_transactions": counts["inserted"],
+            "duplicates_found": len(duplicates),
+            "duplicates_skipped": duplicates_skipped,
+        }
+
+        if stats:
+            result_stats.update(
+                {
+                    "categorized": stats.categorized_count,
+                    "uncategorized": stats.uncategorized_count,
+                    "categorization_rate": stats.categorization_rate,
+                }
+            )
+
+        return transactions, result_stats
+
+    def process_csv_files(
+        self,
+        csv_files: List[Path],
+        auto_categorize: bool = True,
+        overwrite_categories: bool = False,
+        check_duplicates: bool = True,
+        skip_duplicates: bool = True,
+    ) -> tuple[List[Transaction], dict]:
+        """
+        Process several CSV files and store them with a single write.
+
+        Duplicates are checked against stored transactions once per file
+        using the repository's cached fingerprint index; transactions that
+        repeat across the files are stored once.
+
+        Args:
+            csv_files: Paths to CSV files
+            auto_categorize: Whether to automatically categorize transactions
+            overwrite_categories: Whether to overwrite existing categories
+            check_duplicates: Whether to check for duplicates
+            skip_duplicates: Whether to skip duplicate transactions
+
+        Returns:
+            Tuple of (processed transactions, statistics dict summed over files)
+        """
+        all_transactions: List[Transaction] = []
+        total_parsed = 0
+        duplicates_found = 0
+        duplicates_skipped = 0
+        category_totals = CategorizationStats()
+
+        for csv_file in csv_files:
+            logger.info(f"Processing CSV file: {csv_file}")
+            transactions, duplicates, stats = self._prepare_csv_file(
+                csv_file, auto_categorize, overwrite_categories, check_duplicates, skip_duplicates
+            )
+            all_transactions.extend(transactions)
+            skipped = len(duplicates) if skip_duplicates else 0
+            total_parsed += len(transactions) + skipped
+            duplicates_found += len(duplicates)
+            duplicates_skipped += skipped
+            if stats:
+                category_totals.total_transactions += stats.total_transactions
+                category_totals.categorized_count += stats.categorized_count
+                category_totals.uncategorized_count += stats.uncategorized_count
+
+        # Save everything with one write
+        logger.info("Saving transactions to storage...")
+        counts = self.storage.transaction_repo.apply_changeset(inserts=all_transactions)
+        logger.info(f"Saved {counts['inserted']} transactions from {len(csv_files)} files")
+
+        result_stats: Dict[str, float] = {
+            "total_parsed": total_parsed,
+            "new_transactions": counts["inserted"],
+            "duplicates_found": duplicates_found,
+            "duplicates_skipped": duplicates_skipped,
+        }
+
+        if auto_categorize:
+            result_stats.update(
+                {
+                    "categorized": category_totals.categorized_count,
+                    "uncategorized": category_totals.uncategorized_count,
+                    "categorization_rate": category_totals.categorization_rate,
+                }
+            )
+
+        return all_transactions, result_stats
+
+    def _prepare_csv_file(
+        self,
+        csv_file: Path,
+        auto_categorize: bool,
+        overwrite_categories: bool,
+        check_duplicates: bool,
+        skip_duplicates: bool,
+    ) -> tuple[List[Transaction], List[Transaction], Optional[CategorizationStats]]:
+        """
+        Parse, deduplicate and categorize a CSV file without storing it.
+
+        Returns:
+            Tuple of (transactions to store, duplicates found, categorization stats)
+        """
         # Parse CSV
         logger.info("Parsing CSV file...")
         transactions = self.parser.parse(csv_file)
         logger.info(f"Parsed {len(transactions)} transactions")
 
         # Check for duplicates
-        duplicates = []
+        duplicates: List[Transaction] = []
         if check_duplicates:
-            duplicates = self.storage.transaction_repo.check_duplicates(transactions)
+            new_transactions, duplicates = self.storage.transaction_repo.partition_duplicates(
+                transactions
+            )
             if duplicates:
                 logger.warning(f"Found {len(duplicates)} duplicate transactions")
                 if skip_duplicates:
-                    # Create a helper function to get transaction ID
-                    def get_txn_id(t):
-                        parts = [
-                            t.date.isoformat(),
-                            str(t.amount),
-                            t.description.strip().lower(),
-                        ]
-                        if t.reference:
-                            parts.append(t.reference)
-                        return "|".join(parts)
-
-                    transaction_ids = {get_txn_id(t) for t in duplicates}
-                    transactions = [
-                        t for t in transactions if get_txn_id(t) not in transaction_ids
-                    ]
+                    transactions = new_transactions
                     logger.info(f"Skipped {len(duplicates)} duplicates, processing {len(transactions)} new transactions")
 
         # Categorize transactions
@@ -131,29 +242,7 @@ class FinanceTrackerWorkflow:
         else:
             stats = None
 
-        # Save to storage
-        logger.info("Saving transactions to storage...")
-        self.storage.transaction_repo.save(transactions)
-        logger.info(f"Saved {len(transactions)} transactions")
-
-        # Prepare statistics
-        result_stats = {
-            "total_parsed": len(transactions) + len(duplicates),
-            "new_transactions": len(transactions),
-            "duplicates_found": len(duplicates),
-            "duplicates_skipped": len(duplicates) if skip_duplicates else 0,
-        }
-
-        if stats:
-            result_stats.update(
-                {
-                    "categorized": stats.categorized_count,
-                    "uncategorized": stats.uncategorized_count,
-                    "categorization_rate": stats.categorization_rate,
-                }
-            )
-
-        return transactions, result_stats
+        return transactions, duplicates, stats
 
     def analyze_spending(
         self, year: Optional[int] = None, month: Optional[int] = None
@@ -168,13 +257,15 @@ class FinanceTrackerWorkflow:
         Returns:
             SpendingAnalyzer instance
         """
-        transactions = self.storage.transaction_repo.load_all()
-        analyzer = SpendingAnalyzer(transactions)
-        return analyzer
+        with self._cache_lock:
+            transactions = self.load_transactions()
+            if self._analyzer_cache is None:
+                self._analyzer_cache = SpendingAnalyzer(transactions)
+            return self._analyzer_cache
 
     def get_uncategorized_transactions(self) -> List[Transaction]:
         """Get all uncategorized transactions from storage."""
-        transactions = self.storage.transaction_repo.load_all()
+        transactions = self.load_transactions()
         return self.categorizer.get_uncategorized_transactions(transactions)
 
     def recategorize_all(self, overwrite: bool = True) -> dict:
@@ -188,11 +279,21 @@ class FinanceTrackerWorkflow:
             Statistics dictionary
         """
         logger.info("Recategorizing all transactions...")
-        transactions = self.storage.transaction_repo.load_all()
+        transactions = self.load_transactions()
         categorized, stats = self.categorizer.categorize_transactions(transactions, overwrite=overwrite)
 
-        # Save recategorized transactions
-        self.storage.transaction_repo.save(categorized)
+        # Persist only the rows whose category changed; unchanged records are
+        # written back as stored, without re-serializing them
+        changed = [
+            new
+            for old, new in zip(transactions, categorized)
+            if new.category != old.category
+        ]
+        if any(t.id is None for t in changed):
+            # Rows stored without an ID cannot be updated by ID
+            self.storage.transaction_repo.replace_all(categorized)
+        elif changed:
+            self.storage.transaction_repo.apply_changeset(updates=changed)
 
         return {
             "total": stats.total_transactions,
@@ -201,25 +302,89 @@ class FinanceTrackerWorkflow:
             "categorization_rate": stats.categorization_rate,
         }
 
+    def load_transactions(self) -> List[Transaction]:
+        """
+        Load stored transactions, reusing the last load while storage is unchanged.
+
+        Any write changes the repository's data_version, which drops the
+        cached list and analyzer, so writes need no explicit invalidation.
+
+        Returns:
+            Shared list of stored transactions; callers must not modify it
+        """
+        repo = self.storage.transaction_repo
+        with self._cache_lock:
+            version = repo.data_version()
+            if self._txn_cache is None or version != self._txn_cache_version:
+                self._txn_cache = repo.load_all()
+                self._txn_cache_version = version
+                self._analyzer_cache = None
+            return self._txn_cache
+
 
 def process_csv(
     csv_file: Path,
     data_dir: Optional[Path] = None,
     account: Optional[str] = None,
     auto_categorize: bool = True,
+    workflow: Optional[FinanceTrackerWorkflow] = None,
 ) -> tuple[List[Transaction], dict]:
     """
     Convenience function to process a CSV file.
 
+    Without an explicit workflow, calls for the same data directory and
+    account share one workflow (see _get_workflow) and run one at a time.
+
     Args:
         csv_file: Path to CSV file
-        data_dir: Optional data directory
-        account: Optional account identifier
+        data_dir: Optional data directory (ignored if workflow is given)
+        account: Optional account identifier (ignored if workflow is given)
         auto_categorize: Whether to automatically categorize
+        workflow: Optional workflow to use instead of the shared one
 
     Returns:
         Tuple of (processed transactions, statistics)
     """
-    workflow = FinanceTrackerWorkflow(data_dir=data_dir, account=account)
-    return workflow.process_csv_file(csv_file, auto_categorize=auto_categorize)
+    if workflow is not None:
+        return workflow.process_csv_file(csv_file, auto_categorize=auto_categorize)
+
+    shared, lock = _get_workflow(data_dir, account)
+    with lock:
+        return shared.process_csv_file(csv_file, auto_categorize=auto_categorize)
+
+
+# Workflows shared by process_csv, one per (data directory, account). They
+# live for the rest of the process; clear_shared_workflows() releases them.
+_workflows: Dict[
+    Tuple[Optional[Path], Optional[str]], Tuple[FinanceTrackerWorkflow, threading.Lock]
+] = {}
+_workflows_lock = threading.Lock()
+
+
+def _get_workflow(
+    data_dir: Optional[Path], account: Optional[str]
+) -> Tuple[FinanceTrackerWorkflow, threading.Lock]:
+    """
+    Get the shared workflow for a data directory and account.
+
+    Reusing the workflow keeps its parser, categorizer rules and storage
+    caches warm across process_csv calls.
+
+    Returns:
+        Tuple of (workflow, lock that callers hold while using it)
+    """
+    key = (Path(data_dir).resolve() if data_dir is not None else None, account)
+    with _workflows_lock:
+        entry = _workflows.get(key)
+        if entry is None:
+            entry = _workflows[key] = (
+                FinanceTrackerWorkflow(data_dir=data_dir, account=account),
+                threading.Lock(),
+            )
+        return entry
+
 
+def clear_shared_workflows() -> None:
+    """Release the workflows shared by process_csv, dropping their caches."""
+    with _workflows_lock:
+        _workflows.clear()
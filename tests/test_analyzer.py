@@ -114,6 +114,9 @@ class TestSpendingAnalyzer:
         assert len(summaries) == 2  # January and February
         assert summaries[0].month == 1
         assert summaries[1].month == 2
+        assert summaries == [
+            analyzer.get_monthly_summary(s.year, s.month) for s in summaries
+        ]
 
     def test_get_category_breakdown(self, sample_transactions):
         """Test getting category breakdown."""
@@ -183,6 +186,16 @@ class TestSpendingAnalyzer:
 
         assert total > Decimal("0")
 
+    def test_get_totals(self, sample_transactions):
+        """Test that the fused totals match the separate income and expense sums."""
+        analyzer = SpendingAnalyzer(sample_transactions)
+
+        assert analyzer.get_totals() == (
+            analyzer.get_total_income(),
+            analyzer.get_total_expenses(),
+        )
+        assert analyzer.get_totals(2024, 1)[0] == Decimal("3000.00")
+
     def test_get_net_amount(self, sample_transactions):
         """Test calculating net amount."""
         analyzer = SpendingAnalyzer(sample_transactions)
@@ -10,6 +10,7 @@ from finance_tracker.categorizer import (
     TransactionCategorizer,
     categorize_transactions,
 )
+from finance_tracker.category_mapper import CategoryMapper
 from finance_tracker.models import Category, Transaction, TransactionType
 
 
@@ -116,6 +117,40 @@ class TestTransactionCategorizer:
         categorized_list = [t for t in categorized if t.category is not None]
         assert len(categorized_list) > 0
 
+    def test_categorize_transactions_matches_each_description_once(self):
+        """Test that repeated descriptions in a batch are matched against the rules once."""
+
+        class CountingMapper(CategoryMapper):
+            calls = 0
+
+            def categorize(self, description):
+                CountingMapper.calls += 1
+                return super().categorize(description)
+
+        categorizer = TransactionCategorizer(mapper=CountingMapper())
+        transactions = [
+            Transaction(
+                date=date(2024, 1, day),
+                amount=Decimal("-5.00"),
+                description=description,
+                transaction_type=TransactionType.DEBIT,
+            )
+            for day, description in enumerate(
+                ["STARBUCKS COFFEE", "UNKNOWN SHOP", "STARBUCKS COFFEE", "UNKNOWN SHOP"], start=1
+            )
+        ]
+
+        categorized, stats = categorizer.categorize_transactions(transactions)
+
+        assert CountingMapper.calls == 2
+        assert [t.category.name if t.category else None for t in categorized] == [
+            "Coffee Shops",
+            None,
+            "Coffee Shops",
+            None,
+        ]
+        assert stats.categorized_count == 2
+
     def test_categorize_transactions_stats(self, categorizer, sample_transactions):
         """Test categorization statistics."""
         _, stats = categorizer.categorize_transactions(sample_transactions)
@@ -6,14 +6,15 @@ from finance_tracker.category_mapper import CategoryMapper, CategoryRule
 from finance_tracker.models import Category
 
 
+@pytest.fixture(scope="module")
+def mapper():
+    """Create a CategoryMapper instance shared by tests that do not modify it."""
+    return CategoryMapper()
+
+
 class TestCategoryMapper:
     """Tests for CategoryMapper class."""
 
-    @pytest.fixture
-    def mapper(self):
-        """Create a CategoryMapper instance."""
-        return CategoryMapper()
-
     def test_categorize_grocery_store(self, mapper):
         """Test categorizing grocery store transactions."""
         category = mapper.categorize("GROCERY STORE #1234")
@@ -93,8 +94,9 @@ class TestCategoryMapper:
         assert category3 is not None
         assert category1.name == category2.name == category3.name
 
-    def test_add_custom_rule(self, mapper):
+    def test_add_custom_rule(self):
         """Test adding custom categorization rules."""
+        mapper = CategoryMapper()
         mapper.add_custom_rule(r"(?i)\b(custom.?merchant)\b", "Custom Category", "Custom Parent")
         category = mapper.categorize("CUSTOM MERCHANT TRANSACTION")
         assert category is not None
@@ -150,6 +152,21 @@ class TestCategoryMapper:
         # Should match default rule first (first match wins in current implementation)
         assert category is not None
 
+    def test_repeated_descriptions_use_cached_match(self):
+        """Test that match results are reused until the rules change."""
+        mapper = CategoryMapper()
+
+        first = mapper.categorize("LOCAL BAKERY")
+        assert first is None
+        assert mapper.categorize("STARBUCKS") is mapper.categorize(" STARBUCKS ")
+        assert mapper.categorize("STARBUCKS") is mapper.categorize("DUNKIN DONUTS")
+
+        mapper.add_custom_rule(r"bakery", "Bakeries", "Food & Dining")
+        assert mapper.categorize("LOCAL BAKERY").name == "Bakeries"
+
+        mapper.rules = [r for r in mapper.rules if r.category_name != "Bakeries"]
+        assert mapper.categorize("LOCAL BAKERY") is None
+
     def test_empty_description(self, mapper):
         """Test categorizing empty description."""
         category = mapper.categorize("")
@@ -152,6 +152,39 @@ class TestCSVParser:
         transactions = parser.parse(csv_file)
         assert len(transactions) == 2
 
+    def test_iter_parse_streams_rows(self, parser, tmp_path):
+        """Test that iter_parse yields transactions in file order, tolerating short rows."""
+        csv_file = tmp_path / "stream.csv"
+        csv_file.write_text(
+            "Date,Description,Amount,Balance\n"
+            "2024-01-01,First,-10.00,90.00\n"
+            "2024-01-02,Second,25.00\n"
+        )
+
+        transactions = parser.iter_parse(csv_file)
+
+        first = next(transactions)
+        assert first.description == "First"
+        assert first.balance == Decimal("90.00")
+        second = next(transactions)
+        assert second.description == "Second"
+        assert second.balance is None
+        assert list(transactions) == []
+
+    def test_parse_alternative_shares_categories(self, parser, tmp_path):
+        """Test that rows with the same category text share one Category."""
+        csv_file = tmp_path / "alternative.csv"
+        csv_file.write_text(
+            "Transaction Date,Post Date,Description,Category,Type,Amount\n"
+            "01/02/2024,01/03/2024,Store A,Groceries,Debit,-10.00\n"
+            "01/04/2024,01/05/2024,Store B,Groceries,Debit,-20.00\n"
+        )
+
+        first, second = parser.parse(csv_file)
+
+        assert first.category.name == "Groceries"
+        assert first.category is second.category
+
     def test_parse_zero_amount_skipped(self, parser, tmp_path):
         """Test that zero-amount transactions are skipped."""
         csv_file = tmp_path / "zero_amount.csv"
@@ -177,6 +210,16 @@ class TestCSVParser:
         transactions = parser.parse(csv_file)
         assert transactions[0].amount == Decimal("123.45")
 
+    def test_parse_decimal_formats(self):
+        """Test parsing plain, formatted and parenthesized amounts."""
+        assert CSVParser._parse_decimal(" -50.00 ") == Decimal("-50.00")
+        assert CSVParser._parse_decimal("$1,234.56") == Decimal("1234.56")
+        assert CSVParser._parse_decimal("($1,234.56)") == Decimal("-1234.56")
+        with pytest.raises(ValueError):
+            CSVParser._parse_decimal("12 apples")
+        with pytest.raises(ValueError):
+            CSVParser._parse_decimal("Infinity")
+
     def test_parse_date_formats(self, parser):
         """Test parsing different date formats."""
         # ISO format
@@ -191,6 +234,9 @@ class TestCSVParser:
         date3 = CSVParser._parse_date("15/01/2024")
         assert date3 == date(2024, 1, 15)
 
+        # ISO without zero padding
+        assert CSVParser._parse_date("2024-1-5") == date(2024, 1, 5)
+
         # Invalid format
         with pytest.raises(ValueError):
             CSVParser._parse_date("invalid")
@@ -0,0 +1,42 @@
+"""Tests for recurring detector module."""
+
+from datetime import date
+from decimal import Decimal
+
+from finance_tracker.models import Transaction, TransactionType
+from finance_tracker.recurring_detector import RecurringTransactionDetector
+
+
+class TestRecurringTransactionDetector:
+    """Tests for RecurringTransactionDetector."""
+
+    def test_mark_recurring(self):
+        """Test that transactions matching a detected pattern are marked recurring."""
+        subscription = [
+            Transaction(
+                date=date(2024, month, 1),
+                amount=Decimal("-15.99"),
+                description="NETFLIX",
+                transaction_type=TransactionType.DEBIT,
+                id=f"txn-{month}",
+            )
+            for month in (1, 2, 3, 4)
+        ]
+        one_off = Transaction(
+            date=date(2024, 2, 14),
+            amount=Decimal("-60.00"),
+            description="FLOWER SHOP",
+            transaction_type=TransactionType.DEBIT,
+            id="txn-flowers",
+        )
+        detector = RecurringTransactionDetector([*subscription, one_off])
+
+        recurring = detector.detect_recurring()
+        marked = detector.mark_recurring(recurring)
+
+        assert [r.description_pattern for r in recurring] == ["netflix"]
+        assert recurring[0].frequency == "monthly"
+        assert [t.id for t in marked if t.is_recurring] == [t.id for t in subscription]
+        assert {t.recurring_id for t in marked[:4]} == {recurring[0].id}
+        assert marked[4] is one_off
+        assert not one_off.is_recurring
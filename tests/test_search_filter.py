@@ -0,0 +1,89 @@
+"""Tests for search filter module."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_tracker.models import Category, Transaction, TransactionType
+from finance_tracker.search_filter import TransactionSearchFilter
+
+
+class TestTransactionSearchFilter:
+    """Tests for TransactionSearchFilter."""
+
+    @pytest.fixture
+    def transactions(self):
+        """Create transactions across categories, accounts and notes."""
+        groceries = Category(name="Groceries", parent="Food & Dining")
+        coffee = Category(name="Coffee Shops", parent="Food & Dining")
+        return [
+            Transaction(
+                date=date(2024, 1, 5),
+                amount=Decimal("-80.00"),
+                description="WHOLE FOODS MARKET",
+                transaction_type=TransactionType.DEBIT,
+                category=groceries,
+                account="checking",
+            ),
+            Transaction(
+                date=date(2024, 1, 6),
+                amount=Decimal("-4.50"),
+                description="STARBUCKS COFFEE",
+                transaction_type=TransactionType.DEBIT,
+                category=coffee,
+                account="credit",
+                notes="Team meeting at the market",
+            ),
+            Transaction(
+                date=date(2024, 1, 7),
+                amount=Decimal("-35.00"),
+                description="Farmers Market",
+                transaction_type=TransactionType.DEBIT,
+                category=groceries,
+                account="credit",
+            ),
+            Transaction(
+                date=date(2024, 1, 8),
+                amount=Decimal("2000.00"),
+                description="PAYROLL",
+                transaction_type=TransactionType.CREDIT,
+                account="checking",
+            ),
+        ]
+
+    def test_search_text_matches_description_and_notes(self, transactions):
+        """Test that text search finds matches in descriptions and notes, in order."""
+        searcher = TransactionSearchFilter(transactions)
+
+        results = searcher.search(query="market")
+
+        assert [t.description for t in results] == [
+            "WHOLE FOODS MARKET",
+            "STARBUCKS COFFEE",
+            "Farmers Market",
+        ]
+        assert searcher.search(query="zzz") == []
+        assert len(searcher.search(query="a")) == 4
+
+    def test_search_combines_indexed_filters(self, transactions):
+        """Test that category, account and text filters intersect."""
+        searcher = TransactionSearchFilter(transactions)
+
+        results = searcher.search(query="market", category="groceries", account="credit")
+
+        assert [t.description for t in results] == ["Farmers Market"]
+        assert searcher.search(category="Unknown") == []
+
+    def test_indexed_search_matches_full_scan(self, transactions):
+        """Test that repeated searches on one instance agree with fresh instances."""
+        searcher = TransactionSearchFilter(transactions)
+
+        for params in (
+            {"query": "coffee"},
+            {"query": "ket", "account": "checking"},
+            {"category": "Groceries", "amount_min": Decimal("50")},
+            {"account": "checking", "transaction_type": "credit"},
+        ):
+            expected = TransactionSearchFilter(transactions).search(**params)
+            assert searcher.search(**params) == expected
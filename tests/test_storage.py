@@ -1,5 +1,8 @@
 """Tests for storage module."""
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -40,6 +43,31 @@ class TestTransactionRepository:
         assert loaded[0].category is not None
         assert loaded[0].category.name == "Groceries"
 
+    def test_load_shares_category_instances(self, tmp_path):
+        """Test that identical stored categories load as one shared instance."""
+        repo = TransactionRepository(tmp_path)
+        category = Category(name="Groceries", parent="Food & Dining")
+
+        repo.save(
+            [
+                Transaction(
+                    date=date(2024, 1, day),
+                    amount=Decimal("-50.00"),
+                    description="Grocery Store",
+                    transaction_type=TransactionType.DEBIT,
+                    category=category,
+                )
+                for day in (1, 2)
+            ]
+        )
+        loaded = repo.load_all()
+
+        assert loaded[0].category == category
+        assert loaded[0].category is loaded[1].category
+        assert repo.intern_category(Category(name="Groceries", parent="Food & Dining")) is (
+            loaded[0].category
+        )
+
     def test_find_duplicates(self, tmp_path):
         """Test finding duplicate transactions."""
         repo = TransactionRepository(tmp_path)
@@ -56,6 +84,49 @@ class TestTransactionRepository:
 
         assert len(duplicates) == 1
 
+    def test_transaction_id_is_normalized_hash(self, tmp_path):
+        """Test that transaction IDs are integer hashes of normalized fields."""
+        repo = TransactionRepository(tmp_path)
+
+        first = Transaction(
+            date=date(2024, 1, 15),
+            amount=Decimal("-50.00"),
+            description="Test Transaction",
+            transaction_type=TransactionType.DEBIT,
+        )
+        second = Transaction(
+            date=date(2024, 1, 15),
+            amount=Decimal("-50.00"),
+            description="  TEST TRANSACTION ",
+            transaction_type=TransactionType.DEBIT,
+        )
+        with_reference = Transaction(
+            date=date(2024, 1, 15),
+            amount=Decimal("-50.00"),
+            description="Test Transaction",
+            transaction_type=TransactionType.DEBIT,
+            reference="REF123",
+        )
+
+        assert isinstance(repo.transaction_id(first), int)
+        assert repo.transaction_id(first) == repo.transaction_id(second)
+        assert repo.transaction_id(first) != repo.transaction_id(with_reference)
+
+    def test_load_ids_matches_transaction_id(self, tmp_path):
+        """Test that stored fingerprints match freshly computed ones."""
+        repo = TransactionRepository(tmp_path)
+
+        transaction = Transaction(
+            date=date(2024, 1, 15),
+            amount=Decimal("-50.00"),
+            description="Test Transaction",
+            transaction_type=TransactionType.DEBIT,
+            reference="REF123",
+        )
+        repo.save([transaction])
+
+        assert repo.load_ids() == {repo.transaction_id(transaction)}
+
     def test_check_duplicates_against_stored(self, tmp_path):
         """Test checking duplicates against stored transactions."""
         repo = TransactionRepository(tmp_path)
@@ -74,6 +145,70 @@ class TestTransactionRepository:
         duplicates = repo.check_duplicates([transaction])
         assert len(duplicates) == 1
 
+    def test_partition_duplicates(self, tmp_path):
+        """Test splitting transactions into new ones and stored duplicates."""
+        repo = TransactionRepository(tmp_path)
+
+        stored, fresh = (
+            Transaction(
+                date=date(2024, 1, day),
+                amount=Decimal("-50.00"),
+                description="Test Transaction",
+                transaction_type=TransactionType.DEBIT,
+            )
+            for day in (15, 16)
+        )
+        repo.save([stored])
+
+        new, duplicates = repo.partition_duplicates([fresh, stored])
+
+        assert new == [fresh]
+        assert duplicates == [stored]
+
+    def test_check_duplicates_sees_external_writes(self, tmp_path):
+        """Test that the cached fingerprint index notices writes by another repository."""
+        repo = TransactionRepository(tmp_path)
+        other = TransactionRepository(tmp_path)
+
+        transaction = Transaction(
+            date=date(2024, 1, 15),
+            amount=Decimal("-50.00"),
+            description="Test Transaction",
+            transaction_type=TransactionType.DEBIT,
+        )
+
+        assert repo.check_duplicates([transaction]) == []
+
+        other.save([transaction])
+        assert len(repo.check_duplicates([transaction])) == 1
+
+    def test_check_duplicates_sees_same_size_rewrites(self, tmp_path):
+        """Test that a rewrite keeping the file's size and mtime still drops the index."""
+        repo = TransactionRepository(tmp_path)
+
+        stored, rewritten = (
+            Transaction(
+                date=date(2024, 1, 15),
+                amount=Decimal("-50.00"),
+                description=description,
+                transaction_type=TransactionType.DEBIT,
+            )
+            for description in ("Test Transaction", "Best Transaction")
+        )
+        repo.save([stored])
+        assert len(repo.check_duplicates([stored])) == 1
+
+        # Replace the file the way the repository does, then restore its mtime
+        stat = repo.transactions_file.stat()
+        content = repo.transactions_file.read_text(encoding="utf-8")
+        replacement = tmp_path / "replacement.json"
+        replacement.write_text(content.replace("Test Transaction", "Best Transaction"), encoding="utf-8")
+        os.replace(replacement, repo.transactions_file)
+        os.utime(repo.transactions_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert repo.check_duplicates([stored]) == []
+        assert len(repo.check_duplicates([rewritten])) == 1
+
     def test_save_avoids_duplicates(self, tmp_path):
         """Test that save avoids adding duplicates."""
         repo = TransactionRepository(tmp_path)
@@ -92,6 +227,153 @@ class TestTransactionRepository:
         loaded = repo.load_all()
         assert len(loaded) == 1  # Should only have one
 
+    def test_save_reuses_cached_fingerprints(self, tmp_path, monkeypatch):
+        """Test that an insert-only save does not re-fingerprint stored rows."""
+        repo = TransactionRepository(tmp_path)
+
+        first, second = (
+            Transaction(
+                date=date(2024, 1, day),
+                amount=Decimal("-50.00"),
+                description="Test Transaction",
+                transaction_type=TransactionType.DEBIT,
+            )
+            for day in (15, 16)
+        )
+        repo.save([first])
+
+        def fail(record):
+            raise AssertionError("stored record was re-fingerprinted")
+
+        monkeypatch.setattr(repo, "_record_id", fail)
+        repo.save([second, first])
+
+        assert [t.date.day for t in repo.load_all()] == [16, 15]
+
+    def test_get_many(self, tmp_path):
+        """Test fetching several transactions by ID at once."""
+        repo = TransactionRepository(tmp_path)
+
+        repo.save(
+            [
+                Transaction(
+                    date=date(2024, 1, day),
+                    amount=Decimal("-10.00"),
+                    description=f"Transaction {day}",
+                    transaction_type=TransactionType.DEBIT,
+                    id=f"txn-{day}",
+                )
+                for day in (1, 2, 3)
+            ]
+        )
+
+        found = repo.get_many(["txn-3", "txn-1", "missing"])
+
+        assert set(found) == {"txn-1", "txn-3"}
+        assert found["txn-3"].description == "Transaction 3"
+        assert repo.get_by_id("txn-2").description == "Transaction 2"
+        assert repo.get_by_id("missing") is None
+
+    def test_update_many(self, tmp_path):
+        """Test updating several transactions in one call."""
+        repo = TransactionRepository(tmp_path)
+
+        transactions = [
+            Transaction(
+                date=date(2024, 1, day),
+                amount=Decimal("-10.00"),
+                description=f"Transaction {day}",
+                transaction_type=TransactionType.DEBIT,
+                id=f"txn-{day}",
+            )
+            for day in (1, 2, 3)
+        ]
+        repo.save(transactions)
+
+        updates = [
+            transactions[0].model_copy(update={"notes": "first"}),
+            transactions[2].model_copy(update={"notes": "third"}),
+            transactions[1].model_copy(update={"id": "missing"}),
+        ]
+        assert repo.update_many(updates) == 2
+
+        notes = {t.id: t.notes for t in repo.load_all()}
+        assert notes == {"txn-1": "first", "txn-2": None, "txn-3": "third"}
+
+    def test_apply_changeset(self, tmp_path):
+        """Test applying inserts, updates and deletes together."""
+        repo = TransactionRepository(tmp_path)
+
+        transactions = [
+            Transaction(
+                date=date(2024, 1, day),
+                amount=Decimal("-10.00"),
+                description=f"Transaction {day}",
+                transaction_type=TransactionType.DEBIT,
+                id=f"txn-{day}",
+            )
+            for day in (1, 2)
+        ]
+        repo.save(transactions)
+
+        new = Transaction(
+            date=date(2024, 1, 5),
+            amount=Decimal("-5.00"),
+            description="New",
+            transaction_type=TransactionType.DEBIT,
+        )
+        counts = repo.apply_changeset(
+            inserts=[new, transactions[1]],
+            updates=[transactions[1].model_copy(update={"notes": "edited"})],
+            deletes=["txn-1"],
+        )
+
+        assert counts == {"inserted": 1, "updated": 1, "deleted": 1}
+        stored = {t.description: t for t in repo.load_all()}
+        assert set(stored) == {"Transaction 2", "New"}
+        assert stored["Transaction 2"].notes == "edited"
+        assert stored["New"].id is not None
+
+    def test_store_is_kept_newest_first(self, tmp_path):
+        """Test that writes keep stored transactions sorted by date descending."""
+        repo = TransactionRepository(tmp_path)
+
+        for days in ((5, 1), (3, 9)):
+            repo.save(
+                [
+                    Transaction(
+                        date=date(2024, 1, day),
+                        amount=Decimal("-10.00"),
+                        description=f"Transaction {day}",
+                        transaction_type=TransactionType.DEBIT,
+                    )
+                    for day in days
+                ]
+            )
+
+        assert [t.date.day for t in repo.load_all()] == [9, 5, 3, 1]
+
+    def test_concurrent_changesets_keep_all_rows(self, tmp_path):
+        """Test that changesets from several threads do not overwrite each other."""
+        repo = TransactionRepository(tmp_path)
+
+        def save_day(day):
+            repo.save(
+                [
+                    Transaction(
+                        date=date(2024, 1, day),
+                        amount=Decimal("-10.00"),
+                        description=f"Transaction {day}",
+                        transaction_type=TransactionType.DEBIT,
+                    )
+                ]
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(save_day, range(1, 21)))
+
+        assert len(repo.load_all()) == 20
+
 
 class TestCategoryRepository:
     """Tests for CategoryRepository."""
@@ -133,6 +415,9 @@ class TestStorageManager:
         manager.export_transactions_json(output_file)
 
         assert output_file.exists()
+        exported = json.loads(output_file.read_text(encoding="utf-8"))
+        assert [t["description"] for t in exported["transactions"]] == ["Test Transaction"]
+        assert exported["transactions"][0]["amount"] == "-50.00"
 
     def test_export_csv(self, tmp_path):
         """Test exporting transactions to CSV."""
@@ -152,4 +437,7 @@ class TestStorageManager:
         manager.export_transactions_csv(output_file)
 
         assert output_file.exists()
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("Date,Description,Amount,Category")
+        assert lines[1] == "2024-01-15,Test Transaction,-50.00,,,debit,,,,"
 
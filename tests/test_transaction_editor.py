@@ -0,0 +1,232 @@
+"""Tests for transaction editor module."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_tracker.models import Category, SplitTransaction, Transaction, TransactionType
+from finance_tracker.storage import TransactionRepository
+from finance_tracker.transaction_editor import TransactionEditor
+
+
+class TestTransactionEditor:
+    """Tests for TransactionEditor."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository with a few stored transactions."""
+        repo = TransactionRepository(tmp_path)
+        repo.save(
+            [
+                Transaction(
+                    date=date(2024, 1, day),
+                    amount=Decimal("-10.00"),
+                    description=f"Transaction {day}",
+                    transaction_type=TransactionType.DEBIT,
+                    id=f"txn-{day}",
+                )
+                for day in (1, 2, 3)
+            ]
+        )
+        return repo
+
+    @pytest.fixture
+    def editor(self, repo):
+        """Create an editor backed by the repository."""
+        return TransactionEditor(repo)
+
+    def test_edit_transaction(self, editor, repo):
+        """Test editing selected fields of a transaction."""
+        updated = editor.edit_transaction("txn-1", description="Edited", notes="note")
+
+        assert updated is not None
+        assert updated.description == "Edited"
+        assert updated.notes == "note"
+        assert updated.amount == Decimal("-10.00")
+        assert repo.get_by_id("txn-1").description == "Edited"
+
+    def test_edit_transaction_rejects_zero_amount(self, editor):
+        """Test that editing still validates the new amount."""
+        with pytest.raises(ValueError):
+            editor.edit_transaction("txn-1", amount=Decimal("0"))
+
+    def test_edit_missing_transaction(self, editor):
+        """Test editing a transaction that does not exist."""
+        assert editor.edit_transaction("missing", description="Edited") is None
+
+    def test_split_transaction(self, editor, repo):
+        """Test splitting a transaction across categories."""
+        splits = [
+            SplitTransaction(
+                parent_transaction_id="txn-1",
+                amount=Decimal("6.00"),
+                category=Category(name="Groceries"),
+            ),
+            SplitTransaction(
+                parent_transaction_id="txn-1",
+                amount=Decimal("4.00"),
+                category=Category(name="Household"),
+                description="Soap",
+            ),
+        ]
+
+        split_transactions = editor.split_transaction("txn-1", splits)
+
+        assert [t.amount for t in split_transactions] == [Decimal("-6.00"), Decimal("-4.00")]
+        assert split_transactions[1].description == "Transaction 1 - Soap"
+        assert all(t.parent_transaction_id == "txn-1" for t in split_transactions)
+        assert len({t.id for t in split_transactions}) == 2
+        assert len(repo.load_all()) == 5
+
+    def test_split_transaction_validates_total(self, editor):
+        """Test that splits must add up to the original amount."""
+        splits = [
+            SplitTransaction(
+                parent_transaction_id="txn-1",
+                amount=Decimal("5.00"),
+                category=Category(name="Groceries"),
+            )
+        ]
+
+        with pytest.raises(ValueError):
+            editor.split_transaction("txn-1", splits)
+        with pytest.raises(ValueError):
+            editor.split_transaction("txn-1", [])
+        zero_split = SplitTransaction(
+            parent_transaction_id="txn-1", amount=Decimal("0"), category=Category(name="Fees")
+        )
+        with pytest.raises(ValueError):
+            editor.split_transaction("txn-1", [zero_split, *splits, *splits])
+
+        mixed_signs = [
+            split.model_copy(update={"amount": amount})
+            for split, amount in ((splits[0], Decimal("15.00")), (splits[0], Decimal("-5.00")))
+        ]
+        with pytest.raises(ValueError):
+            editor.split_transaction("txn-1", mixed_signs)
+
+        # Each split rounds to 2.00, but together they are 0.02 over
+        sub_cent = [splits[0].model_copy(update={"amount": Decimal("2.004")})] * 5
+        with pytest.raises(ValueError):
+            editor.split_transaction("txn-1", sub_cent)
+
+    def test_merge_transactions_keep_first(self, editor, repo):
+        """Test merging transactions onto the first one."""
+        merged = editor.merge_transactions(["txn-1", "txn-2"])
+
+        assert merged.amount == Decimal("-20.00")
+        assert merged.description == "Transaction 1 (merged)"
+        stored = {t.id: t for t in repo.load_all()}
+        assert "txn-1" not in stored
+        assert "txn-2" not in stored
+        assert merged.id in stored
+
+    def test_merge_reports_all_missing(self, editor, repo):
+        """Test that merging reports every missing ID and writes nothing."""
+        version = repo.data_version()
+
+        with pytest.raises(ValueError, match="missing-1, missing-2"):
+            editor.merge_transactions(["txn-1", "missing-1", "missing-2"])
+
+        assert repo.data_version() == version
+
+    def test_bulk_edit(self, editor, repo):
+        """Test bulk editing category and notes."""
+        category = Category(name="Groceries", parent="Food & Dining")
+
+        count = editor.bulk_edit(["txn-1", "txn-3", "missing"], category=category, notes="bulk")
+
+        assert count == 2
+        stored = {t.id: t for t in repo.load_all()}
+        assert stored["txn-1"].category == category
+        assert stored["txn-1"].notes == "bulk"
+        assert stored["txn-2"].category is None
+
+    def test_cache_sees_external_writes(self, editor, repo, tmp_path):
+        """Test that cached lookups are refreshed after another writer changes storage."""
+        editor.edit_transaction("txn-1", notes="first")
+
+        other = TransactionRepository(tmp_path)
+        other.update(other.get_by_id("txn-1").model_copy(update={"description": "Changed elsewhere"}))
+
+        updated = editor.edit_transaction("txn-1", notes="second")
+        assert updated.description == "Changed elsewhere"
+        assert updated.notes == "second"
+
+    def test_noop_edit_skips_write(self, editor, repo):
+        """Test that edits which change nothing leave storage untouched."""
+        version = repo.data_version()
+
+        unchanged = editor.edit_transaction("txn-1", description="Transaction 1")
+        assert unchanged.description == "Transaction 1"
+        assert editor.edit_transaction("txn-1") is not None
+        assert editor.bulk_edit(["txn-1", "txn-2"]) == 2
+
+        assert repo.data_version() == version
+
+    def test_delete_multiple_ignores_duplicate_ids(self, editor, repo):
+        """Test that repeated IDs are deleted and counted once."""
+        version = repo.data_version()
+        assert editor.delete_multiple([]) == 0
+        assert repo.data_version() == version
+
+        assert editor.delete_multiple(["txn-1", "txn-1", "txn-2"]) == 2
+        assert {t.id for t in repo.load_all()} == {"txn-3"}
+
+    def test_batch_writes_once(self, editor, repo):
+        """Test that changes inside a batch are buffered and written together."""
+        version = repo.data_version()
+
+        with editor.batch():
+            editor.edit_transaction("txn-1", notes="batched")
+            merged = editor.merge_transactions(["txn-2", "txn-3"])
+            editor.edit_transaction(merged.id, notes="merged")
+            assert editor.delete_transaction("txn-2") is False
+            assert editor.edit_transaction("txn-1", description="Edited").notes == "batched"
+            assert repo.data_version() == version
+
+        stored = {t.id: t for t in repo.load_all()}
+        assert set(stored) == {"txn-1", merged.id}
+        assert stored["txn-1"].description == "Edited"
+        assert stored["txn-1"].notes == "batched"
+        assert stored[merged.id].notes == "merged"
+
+    def test_batch_sees_writes_made_before_it(self, editor, repo, tmp_path):
+        """Test that a batch does not reuse rows cached before an external write."""
+        editor.edit_transaction("txn-1", notes="first")
+
+        other = TransactionRepository(tmp_path)
+        other.update(other.get_by_id("txn-1").model_copy(update={"description": "Changed elsewhere"}))
+
+        with editor.batch():
+            editor.edit_transaction("txn-1", notes="second")
+
+        stored = repo.get_by_id("txn-1")
+        assert stored.description == "Changed elsewhere"
+        assert stored.notes == "second"
+
+    def test_batch_keeps_buffered_rows_past_cache_size(self, editor, repo, monkeypatch):
+        """Test that buffered edits stay visible when the lookup cache evicts them."""
+        monkeypatch.setattr("finance_tracker.transaction_editor.CACHE_SIZE", 1)
+
+        with editor.batch():
+            editor.edit_transaction("txn-1", notes="first")
+            editor.edit_transaction("txn-2", notes="second")
+            editor.edit_transaction("txn-1", description="Edited")
+
+        stored = repo.get_by_id("txn-1")
+        assert stored.description == "Edited"
+        assert stored.notes == "first"
+
+    def test_batch_discards_on_error(self, editor, repo):
+        """Test that a failing batch writes nothing."""
+        version = repo.data_version()
+
+        with pytest.raises(RuntimeError):
+            with editor.batch():
+                editor.delete_transaction("txn-1")
+                raise RuntimeError("abort")
+
+        assert repo.data_version() == version
+        assert editor.edit_transaction("txn-1", notes="kept").notes == "kept"
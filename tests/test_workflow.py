@@ -8,7 +8,7 @@ from tempfile import TemporaryDirectory
 import pytest
 
 from finance_tracker.models import Transaction, TransactionType
-from finance_tracker.workflow import FinanceTrackerWorkflow
+from finance_tracker.workflow import FinanceTrackerWorkflow, process_csv
 
 
 class TestFinanceTrackerWorkflow:
@@ -45,6 +45,58 @@ class TestFinanceTrackerWorkflow:
         assert stats["duplicates_found"] > 0
         assert stats["new_transactions"] == 0  # All should be duplicates
 
+    def test_total_parsed_when_keeping_duplicates(self, sample_csv, tmp_path):
+        """Test that kept duplicates are not counted twice in total_parsed."""
+        workflow = FinanceTrackerWorkflow(data_dir=tmp_path / "data")
+        workflow.process_csv_file(sample_csv)
+
+        _, stats = workflow.process_csv_file(sample_csv, skip_duplicates=False)
+
+        assert stats["total_parsed"] == 1
+        assert stats["new_transactions"] == 0
+        assert stats["duplicates_found"] == 1
+        assert stats["duplicates_skipped"] == 0
+
+    def test_process_csv_convenience_function(self, sample_csv, tmp_path):
+        """Test that repeated process_csv calls share storage and detect duplicates."""
+        data_dir = tmp_path / "data"
+
+        _, first = process_csv(sample_csv, data_dir=data_dir)
+        _, second = process_csv(sample_csv, data_dir=data_dir)
+
+        assert first["new_transactions"] == 1
+        assert second["new_transactions"] == 0
+        assert second["duplicates_found"] == 1
+
+    def test_process_csv_with_explicit_workflow(self, sample_csv, tmp_path):
+        """Test that process_csv uses a workflow passed in by the caller."""
+        workflow = FinanceTrackerWorkflow(data_dir=tmp_path / "data")
+
+        _, stats = process_csv(sample_csv, workflow=workflow)
+
+        assert stats["new_transactions"] == 1
+        assert len(workflow.load_transactions()) == 1
+
+    def test_process_csv_files(self, sample_csv, tmp_path):
+        """Test importing several CSV files with one write."""
+        other_csv = tmp_path / "other.csv"
+        other_csv.write_text(
+            "Date,Description,Amount,Balance\n"
+            "2024-01-15,Test Transaction,-50.00,1000.00\n"
+            "2024-01-16,STARBUCKS COFFEE,-5.00,995.00\n"
+        )
+        workflow = FinanceTrackerWorkflow(data_dir=tmp_path / "data")
+
+        _, stats = workflow.process_csv_files([sample_csv, other_csv])
+
+        assert stats["total_parsed"] == 3
+        assert stats["new_transactions"] == 2  # Repeated row is stored once
+        assert len(workflow.storage.transaction_repo.load_all()) == 2
+
+        _, stats = workflow.process_csv_files([sample_csv, other_csv])
+        assert stats["duplicates_found"] == 3
+        assert stats["new_transactions"] == 0
+
     def test_analyze_spending(self, tmp_path):
         """Test analyzing spending."""
         workflow = FinanceTrackerWorkflow(data_dir=tmp_path)
@@ -63,6 +115,29 @@ class TestFinanceTrackerWorkflow:
         analyzer = workflow.analyze_spending()
         assert analyzer is not None
 
+    def test_analyze_spending_reuses_analyzer_until_storage_changes(self, sample_csv, tmp_path):
+        """Test that the analyzer is cached and rebuilt after new transactions are saved."""
+        workflow = FinanceTrackerWorkflow(data_dir=tmp_path / "data")
+
+        workflow.process_csv_file(sample_csv)
+        analyzer = workflow.analyze_spending()
+        assert workflow.analyze_spending() is analyzer
+
+        workflow.storage.transaction_repo.save(
+            [
+                Transaction(
+                    date=date(2024, 2, 1),
+                    amount=Decimal("-20.00"),
+                    description="Another",
+                    transaction_type=TransactionType.DEBIT,
+                )
+            ]
+        )
+        refreshed = workflow.analyze_spending()
+        assert refreshed is not analyzer
+        assert len(refreshed.transactions) == 2
+        assert refreshed.transactions is workflow.load_transactions()
+
     def test_get_uncategorized_transactions(self, tmp_path):
         """Test getting uncategorized transactions."""
         workflow = FinanceTrackerWorkflow(data_dir=tmp_path)
@@ -80,3 +155,28 @@ class TestFinanceTrackerWorkflow:
         uncategorized = workflow.get_uncategorized_transactions()
         assert len(uncategorized) >= 0  # May or may not be categorized
 
+    def test_recategorize_all_persists(self, tmp_path):
+        """Test that recategorized transactions are written back to storage."""
+        workflow = FinanceTrackerWorkflow(data_dir=tmp_path)
+        workflow.storage.transaction_repo.save(
+            [
+                Transaction(
+                    date=date(2024, 1, 15),
+                    amount=Decimal("-5.00"),
+                    description="STARBUCKS COFFEE",
+                    transaction_type=TransactionType.DEBIT,
+                )
+            ]
+        )
+
+        stats = workflow.recategorize_all()
+
+        assert stats["categorized"] == 1
+        stored = workflow.storage.transaction_repo.load_all()
+        assert stored[0].category is not None
+        assert stored[0].category.name == "Coffee Shops"
+        assert stored[0].id is not None
+
+        version = workflow.storage.transaction_repo.data_version()
+        workflow.recategorize_all()
+        assert workflow.storage.transaction_repo.data_version() == version
@@ -10,9 +10,8 @@ const itemsPerPage = 50;
 document.addEventListener('DOMContentLoaded', async () => {
     setupTabs();
     setupFileUpload();
-    await loadDashboard();
-    await loadTransactions();
-    await loadCategories();
+    const dashboard = await loadDashboard();
+    await loadCategories(dashboard?.spending_patterns);
     await loadCategoryRules();
 });
 
@@ -135,9 +134,8 @@ async function importCSV() {
             document.getElementById('import-btn').disabled = true;
             
             // Reload data
-            await loadDashboard();
-            await loadTransactions();
-            await loadCategories();
+            const dashboard = await loadDashboard();
+            await loadCategories(dashboard?.spending_patterns);
         } else {
             showStatus(`Error: ${result.error || 'Unknown error'}`, 'error');
         }
@@ -159,17 +157,21 @@ function showStatus(message, type) {
 // Load Dashboard
 async function loadDashboard() {
     try {
-        const stats = await eel.get_overall_stats()();
-        updateStats(stats);
+        // Includes the first page of transactions, so the table needs no extra calls
+        const dashboard = await eel.get_dashboard_bundle(1, itemsPerPage)();
+        updateStats(dashboard.stats);
         
-        const summaries = await eel.get_monthly_summaries()();
+        const summaries = dashboard.monthly_summaries;
         updateMonthlySummaries(summaries);
         updateMonthlyChart(summaries);
         
-        const categoryBreakdown = await eel.get_category_breakdown()();
-        updateCategoryChart(categoryBreakdown);
+        updateCategoryChart(dashboard.category_breakdown);
+        displayTransactions(dashboard.transactions);
+        updatePagination(dashboard.transactions_count);
+        return dashboard;
     } catch (error) {
         console.error('Error loading dashboard:', error);
+        return null;
     }
 }
 
@@ -318,7 +320,7 @@ async function loadTransactions(page = 1) {
     try {
         const transactions = await eel.get_transactions(page, itemsPerPage)();
         displayTransactions(transactions);
-        updatePagination(transactions.length);
+        updatePagination(await eel.get_transactions_count()());
     } catch (error) {
         console.error('Error loading transactions:', error);
     }
@@ -361,10 +363,12 @@ function displayTransactions(transactions) {
     }).catch(err => console.error('Error loading filters:', err));
 }
 
-// Load Categories
-async function loadCategories() {
+// Load Categories (patterns may come from the dashboard bundle)
+async function loadCategories(patterns = null) {
     try {
-        const patterns = await eel.get_spending_patterns()();
+        if (!patterns) {
+            patterns = await eel.get_spending_patterns()();
+        }
         displayTopCategories(patterns);
         displayCategoriesList(patterns);
     } catch (error) {